@@ -11,11 +11,13 @@ from datetime import datetime, timezone
 
 import pandas as pd
 from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import Response, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
 from . import store, config
 from . import html as html_mod
+from .backends import df_to_records
 from .ui_config import get_ui_settings
 from .renderers import register_default_renderers
 from .renderers.registry import render_any
@@ -23,15 +25,28 @@ from .storage.worker import enqueue_snapshot
 from .storage.backend import list_snapshots, load_snapshot
 
 
+# Responses smaller than this are sent as-is; gzip framing would outweigh
+# the saving. Level 5 keeps compression cheap for large table/JSON pages.
+_GZIP_MINIMUM_SIZE = 1024
+_GZIP_LEVEL = 5
+
+
 def _build_app() -> FastAPI:
     docs_enabled = config.get_docs_enabled()
     openapi_enabled = config.get_openapi_enabled()
 
-    return FastAPI(
+    built = FastAPI(
         docs_url="/docs" if docs_enabled else None,
         redoc_url="/redoc" if docs_enabled else None,
         openapi_url="/openapi.json" if openapi_enabled else None,
     )
+    # Compress text responses (pages, table/JSON data, exports) for clients
+    # sending Accept-Encoding: gzip. Starlette 1.5+ (the floor in pyproject)
+    # leaves already-compressed types such as image/png alone.
+    built.add_middleware(
+        GZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE, compresslevel=_GZIP_LEVEL
+    )
+    return built
 
 
 app = _build_app()
@@ -383,7 +398,7 @@ def get_table_data(
         max_rows = min(limit, config.get_max_table_rows_rich())
         rows_df = df.head(max_rows)
         columns = list(rows_df.columns)
-        rows = rows_df.to_dict(orient="records")
+        rows = df_to_records(rows_df)
 
         total_rows = None
         returned_rows = None
@@ -412,7 +427,7 @@ def get_table_data(
 
     rows_df = df.head(max_rows)
     columns = list(rows_df.columns)
-    rows = rows_df.to_dict(orient="records")
+    rows = df_to_records(rows_df)
 
     total_rows, returned_rows = store.get_table_counts(view_id=vid)
 
@@ -476,9 +491,44 @@ def export_table(
 
 
 @app.post("/publish")
-def publish(request: Request, payload: dict[str, Any]) -> dict[str, Any]:
+def publish(
+    request: Request, payload: dict[str, Any] | list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Publish a plot, table or artifact into a specific view.
+
+    The body is either one payload (below) or a list of payloads, as sent by
+    publisher.publish_batch(). A list is applied in order; each item gets its
+    own result and a rejected item does not stop the rest:
+      {"ok": True, "results": [{"ok": True, ...}, {"ok": False, "status_code": 413, ...}]}
+    """
+    if config.get_control_local_only():
+        require_local_request(request)
+
+    if isinstance(payload, dict):
+        return _publish_one(payload)
+
+    max_items = config.get_publish_max_batch_items()
+    if len(payload) > max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"publish: batch has too many items (>{max_items})",
+        )
+
+    results: list[dict[str, Any]] = []
+    for item in payload:
+        try:
+            results.append(_publish_one(item))
+        except HTTPException as e:
+            results.append(
+                {"ok": False, "status_code": e.status_code, "detail": e.detail}
+            )
+    return {"ok": True, "results": results}
+
+
+def _publish_one(payload: dict[str, Any]) -> dict[str, Any]:
     """
-    Publish a plot or table into a specific view.
+    Apply a single publish payload.
 
     Expected payload (flexible):
       {
@@ -498,9 +548,6 @@ def publish(request: Request, payload: dict[str, Any]) -> dict[str, Any]:
         "force": false                # optional bypass throttling
       }
     """
-    if config.get_control_local_only():
-        require_local_request(request)
-
     kind = str(payload.get("kind") or "").strip().lower()
     if kind not in ("plot", "table", "artifact"):
         raise HTTPException(
@@ -657,7 +704,7 @@ def publish(request: Request, payload: dict[str, Any]) -> dict[str, Any]:
             )
 
         for i, row in enumerate(rows[:50]):
-            if isinstance(row, dict) and len(row) > max_cols:
+            if isinstance(row, (dict, list)) and len(row) > max_cols:
                 raise HTTPException(
                     status_code=413,
                     detail=f"publish: table row {i} has too many fields (>{max_cols})",
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import io
+import sys
 from typing import Any
 
 import pandas as pd
@@ -10,6 +11,17 @@ from matplotlib.figure import Figure
 from . import config
 
 
+def plotnine_ggplot_type() -> type | None:
+    """
+    Return plotnine's ggplot class if plotnine has been imported, else None.
+
+    plotnine is optional and slow to import. A ggplot can only exist once it
+    has been imported, so plot checks look the class up instead of importing.
+    """
+    mod = sys.modules.get("plotnine.ggplot")
+    return getattr(mod, "ggplot", None)
+
+
 def fig_to_png_bytes(fig: Figure) -> bytes:
     """Render a matplotlib Figure to PNG bytes."""
     buf = io.BytesIO()
@@ -18,6 +30,7 @@ def fig_to_png_bytes(fig: Figure) -> bytes:
     default_size = config.get_plot_default_figsize_in()
     bbox_tight = config.get_plot_bbox_tight()
     pad_inches = config.get_plot_pad_inches()
+    compress_level = config.get_plot_png_compress_level()
 
     # Matplotlib default figure size is typically (6.4, 4.8).
     # If the user hasn't chosen a size (still default), we can "upgrade"
@@ -31,7 +44,12 @@ def fig_to_png_bytes(fig: Figure) -> bytes:
             mutated = True
 
     try:
-        save_kwargs: dict[str, Any] = {"format": "png", "dpi": dpi}
+        save_kwargs: dict[str, Any] = {
+            "format": "png",
+            "dpi": dpi,
+            # PNG stays lossless; lower levels trade size for encode time.
+            "pil_kwargs": {"compress_level": compress_level},
+        }
         if bbox_tight:
             save_kwargs["bbox_inches"] = "tight"
             save_kwargs["pad_inches"] = pad_inches
@@ -57,25 +75,43 @@ def df_to_html_simple(df: pd.DataFrame, max_rows: int) -> str:
     )
 
 
-def df_to_rich_sample(
+def _nulls_to_none(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return an object-dtype copy with NaN/NaT/None mapped to None.
+
+    One vectorised pass rather than per cell, since strict JSON encoders
+    reject NaN.
+    """
+    return df.astype(object).where(df.notna(), None)
+
+
+def df_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Convert a DataFrame to JSON-safe row records.
+    """
+    return _nulls_to_none(df).to_dict(orient="records")
+
+
+def df_to_split_sample(
     df: pd.DataFrame,
     max_rows: int,
 ) -> dict[str, Any]:
     """
-    Build a JSON-serialisable sample for rich mode (Tabulator).
+    Build a compact JSON-serialisable table sample for publishing.
 
     Returns:
       {
         "columns": [...],
-        "rows": [...],
+        "rows": [[...], ...],  # lists in column order, missing values as None
         "total_rows": int,
         "returned_rows": int,
       }
     """
     trimmed = df.head(max_rows)
+    split = _nulls_to_none(trimmed).to_dict(orient="split", index=False)
     return {
-        "columns": list(trimmed.columns),
-        "rows": trimmed.to_dict(orient="records"),
+        "columns": list(split["columns"]),
+        "rows": split["data"],
         "total_rows": int(len(df)),
         "returned_rows": int(len(trimmed)),
     }
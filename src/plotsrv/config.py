@@ -30,6 +30,7 @@ _DEFAULTS: dict[str, Any] = {
         "plot_default_figsize_in": (12.0, 6.0),
         "plot_bbox_tight": True,
         "plot_pad_inches": 0.10,
+        "plot_png_compress_level": 3,
     },
     "artifact-render-settings": {
         "html_sanitize": False,
@@ -95,6 +96,7 @@ _DEFAULTS: dict[str, Any] = {
         "max_table_columns": 200,
         "max_artifact_text_chars": 200_000,
         "max_json_container_items": 20_000,
+        "max_batch_items": 256,
     },
 }
 
@@ -406,6 +408,12 @@ def get_plot_pad_inches() -> float:
     return _as_float(sec.get("plot_pad_inches"), 0.10, min_value=0.0)
 
 
+def get_plot_png_compress_level() -> int:
+    sec = _merged_section("render-settings")
+    level = _as_int_or_inf(sec.get("plot_png_compress_level"), 3, min_value=0)
+    return min(level, 9)
+
+
 # ---- Artifact render settings ------------------------------------------------
 
 
@@ -893,3 +901,8 @@ def get_publish_max_artifact_text_chars() -> int:
 def get_publish_max_json_container_items() -> int:
     sec = _merged_section("publish-limits")
     return _as_int_or_inf(sec.get("max_json_container_items"), 20_000, min_value=1)
+
+
+def get_publish_max_batch_items() -> int:
+    sec = _merged_section("publish-limits")
+    return _as_int_or_inf(sec.get("max_batch_items"), 256, min_value=1)
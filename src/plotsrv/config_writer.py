@@ -51,6 +51,7 @@ render-settings:
     plot_default_figsize_in: "12,6"
     plot_bbox_tight: true
     plot_pad_inches: 0.10
+    plot_png_compress_level: 3
 
 storage-settings:
   enabled: false
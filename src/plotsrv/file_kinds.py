@@ -7,6 +7,11 @@ from pathlib import Path
 from typing import Any, Literal
 from .json_model import build_json_document
 
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 FileKind = Literal[
     "text",
     "json",
@@ -92,6 +97,89 @@ def _build_structured_document(
     )
 
 
+def _json_loads(txt: str) -> Any:
+    """
+    Parse JSON text, using orjson's faster parser when it is installed.
+
+    orjson is stricter than the stdlib (no NaN/Infinity literals, integers
+    limited to 64 bits), so anything it rejects is retried with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(txt)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(txt)
+
+
+def _read_csv_frame(raw: bytes, *, encoding: str, nrows: int | None) -> Any:
+    """
+    Parse CSV bytes into a pandas DataFrame.
+
+    For UTF-8 input, pyarrow's C++ reader is used when it is installed. The
+    file is streamed in batches, so with a row limit parsing stops once
+    enough rows have been read. Its output is kept in line with the pandas
+    reader: date/time columns stay strings, and files pandas would treat
+    specially (duplicate or blank header names, malformed rows) are left to
+    pandas. Input pyarrow rejects (ArrowInvalid, e.g. undecodable bytes) and
+    other encodings go to pandas' python engine, which tolerates the most
+    input.
+    """
+    import codecs
+    import io
+    import pandas as pd
+
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pacsv  # type: ignore
+    except ImportError:
+        pa = None
+
+    if pa is not None and codecs.lookup(encoding).name == "utf-8":
+
+        def open_reader(column_types: dict[str, Any]) -> Any:
+            return pacsv.open_csv(
+                io.BytesIO(raw),
+                read_options=pacsv.ReadOptions(encoding="utf8"),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=column_types, strings_can_be_null=True
+                ),
+            )
+
+        try:
+            reader = open_reader({})
+            names = reader.schema.names
+            if len(set(names)) == len(names) and all(names):
+                temporal = {
+                    f.name: pa.string()
+                    for f in reader.schema
+                    if pa.types.is_temporal(f.type)
+                }
+                if temporal:
+                    reader = open_reader(temporal)
+                batches = []
+                seen = 0
+                for batch in reader:
+                    batches.append(batch)
+                    seen += batch.num_rows
+                    if nrows is not None and seen >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                if nrows is not None:
+                    table = table.slice(0, nrows)
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+        except pa.ArrowInvalid:
+            pass
+
+    return pd.read_csv(
+        io.StringIO(raw.decode(encoding, errors="replace")),
+        nrows=nrows,
+        engine="python",
+        on_bad_lines="skip",
+    )
+
+
 def coerce_file_to_publishable(
     path: Path,
     *,
@@ -119,7 +207,7 @@ def coerce_file_to_publishable(
 
     if fk == "json":
         txt = raw.decode(encoding, errors="replace")
-        parsed = json.loads(txt)
+        parsed = _json_loads(txt)
         doc = _build_structured_document(
             parsed,
             raw_text=txt,
@@ -241,9 +329,6 @@ def coerce_file_to_publishable(
         )
 
     if fk == "csv":
-        import io
-        import pandas as pd
-
         nrows = None
         if max_rows is not None:
             try:
@@ -251,15 +336,7 @@ def coerce_file_to_publishable(
             except Exception:
                 nrows = None
 
-        txt = raw.decode(encoding, errors="replace")
-        buf = io.StringIO(txt)
-
-        df = pd.read_csv(
-            buf,
-            nrows=nrows,
-            engine="python",
-            on_bad_lines="skip",
-        )
+        df = _read_csv_frame(raw, encoding=encoding, nrows=nrows)
         return FileCoerceResult(
             publish_kind="table",
             artifact_kind=None,
@@ -67,6 +67,9 @@ def render_index(
         default="/static/plotsrv_favicon.png",
     )
 
+    # Fixed fragments (tabulator head, empty state, ...) are plain string
+    # literals, so they are compile-time constants that are never dedented or
+    # rebuilt per render; hoisting them to module level would save nothing.
     tabulator_head = ""
     include_tabulator = kind in ("table", "artifact") and table_view_mode != "simple"
 
@@ -146,6 +149,15 @@ def render_index(
           </label>
         """
 
+    def _controls_html(*leading: str) -> str:
+        # Build the footer controls in one join rather than chained "+" so
+        # each fragment is copied once.
+        parts = list(leading)
+        parts.append(_history_controls_html())
+        parts.append(_auto_refresh_controls_html())
+        parts.append(_terminate_button_html())
+        return "".join(parts)
+
     LOGO_BY_KEY = {
         "unknown": "/static/logo_unknown.png",
         "plot": "/static/logo_plot.png",
@@ -286,18 +298,15 @@ def render_index(
     footer_html = ""
 
     if kind == "table":
-        controls_html = (
-            _refresh_control_html("window.location.reload()")
-            + (
+        controls_html = _controls_html(
+            _refresh_control_html("window.location.reload()"),
+            (
                 """
                 <button type="button" class="ps-btn" onclick="exportTable()">Export table</button>
                 """
                 if ui.export_table
                 else ""
-            )
-            + _history_controls_html()
-            + _auto_refresh_controls_html()
-            + _terminate_button_html()
+            ),
         )
 
         table_shell_open = """
@@ -404,18 +413,15 @@ def render_index(
         footer_html = _footer_html(controls_html=controls_html)
 
     elif kind == "plot":
-        controls_html = (
-            _refresh_control_html("refreshPlot()")
-            + (
+        controls_html = _controls_html(
+            _refresh_control_html("refreshPlot()"),
+            (
                 """
                 <button type="button" class="ps-btn" onclick="exportImage()">Export image</button>
                 """
                 if ui.export_image
                 else ""
-            )
-            + _history_controls_html()
-            + _auto_refresh_controls_html()
-            + _terminate_button_html()
+            ),
         )
 
         content_html = f"""
@@ -426,14 +432,11 @@ def render_index(
         footer_html = _footer_html(controls_html=controls_html)
 
     elif kind == "artifact":
-        controls_html = (
-            _refresh_control_html("refreshArtifact()")
-            + """
+        controls_html = _controls_html(
+            _refresh_control_html("refreshArtifact()"),
+            """
                 <button type="button" class="ps-btn" onclick="exportArtifact()">Export</button>
-                """
-            + _history_controls_html()
-            + _auto_refresh_controls_html()
-            + _terminate_button_html()
+                """,
         )
 
         content_html = """
@@ -450,11 +453,8 @@ def render_index(
         footer_html = _footer_html(controls_html=controls_html)
 
     else:
-        controls_html = (
-            _refresh_control_html("window.location.reload()")
-            + _history_controls_html()
-            + _auto_refresh_controls_html()
-            + _terminate_button_html()
+        controls_html = _controls_html(
+            _refresh_control_html("window.location.reload()"),
         )
 
         content_html = """
@@ -471,6 +471,8 @@ def render_index(
     header_text = _escape_html(ui.header_text or "")
     logo_url = _safe_url_attr(ui.logo_url or "/static/plotsrv_brush_stroke_logo.png")
 
+    # Five scalars, each of which may differ per request. Dumping them costs a
+    # few microseconds of a page render, so no static part is cached.
     cfg_json = json.dumps(
         {
             "active_view_id": active_view_id,
@@ -1,10 +1,19 @@
 # src/plotsrv/json_model.py
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+import itertools
 import json
 from typing import Any
 
+from .backends import plotnine_ggplot_type
+
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 try:  # pragma: no cover
     import pandas as pd
 except Exception:  # pragma: no cover
@@ -20,11 +29,6 @@ try:  # pragma: no cover
 except Exception:  # pragma: no cover
     Figure = None  # type: ignore[assignment]
 
-try:  # pragma: no cover
-    from plotnine.ggplot import ggplot as PlotnineGGPlot  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    PlotnineGGPlot = None  # type: ignore[assignment]
-
 
 @dataclass(frozen=True, slots=True)
 class JsonModelLimits:
@@ -40,6 +44,8 @@ class JsonModelLimits:
 class _BuildCtx:
     limits: JsonModelLimits
     nodes_seen: int = 0
+    # Values _count_below() may still visit for values that were not built.
+    count_budget: int = 0
     max_depth_seen: int = 0
     truncated: bool = False
     hit: str | None = None
@@ -82,7 +88,7 @@ def build_json_document(
     This is the new canonical payload for artifact_kind="json".
     """
     lim = _coerce_limits(limits)
-    ctx = _BuildCtx(limits=lim)
+    ctx = _BuildCtx(limits=lim, count_budget=lim.max_nodes)
 
     root = _build_node(
         obj,
@@ -115,9 +121,24 @@ def build_json_document(
 def build_pretty_text(obj: Any) -> str:
     """
     Best-effort pretty text representation for Text mode.
+
+    The stdlib only uses its C encoder when indent is None, so with orjson
+    installed the indented text is produced by orjson instead. Values are
+    normalised by _to_json_compatible() first (NaN/Inf become null, DataFrame
+    samples included), and anything orjson rejects or would format
+    differently (integers wider than 64 bits, floats below 1e-4) falls back
+    to json.dumps, so the text does not depend on whether orjson is installed.
     """
     try:
-        return json.dumps(_to_json_compatible(obj), indent=2, ensure_ascii=False)
+        compatible = _to_json_compatible(obj)
+        if orjson is not None:
+            try:
+                return orjson.dumps(compatible, option=orjson.OPT_INDENT_2).decode(
+                    "utf-8"
+                )
+            except TypeError:
+                pass
+        return json.dumps(compatible, indent=2, ensure_ascii=False)
     except Exception:
         try:
             return repr(obj)
@@ -246,6 +267,7 @@ def _build_node(
         "child_count": 0,
         "descendant_count": 0,
         "descendant_layer_count": 0,
+        "descendant_count_capped": False,
         "expandable": False,
         "children": [],
         "truncated": False,
@@ -261,13 +283,11 @@ def _build_node(
             base["truncated"] = True
             base["truncation_reason"] = "depth limit"
             base["child_count"] = len(obj)
-            base["descendant_count"] = _count_descendants(obj)
-            base["descendant_layer_count"] = _count_remaining_layers(obj)
+            _set_descendant_counts(base, len(obj), [], obj.values(), ctx=ctx)
             return base
 
-        items = list(obj.items())
-        shown = items[: ctx.limits.max_dict_items]
-        if len(items) > len(shown):
+        shown = list(itertools.islice(obj.items(), ctx.limits.max_dict_items))
+        if len(obj) > len(shown):
             ctx.truncated = True
             ctx.hit = ctx.hit or "max_dict_items"
             base["truncated"] = True
@@ -286,32 +306,40 @@ def _build_node(
                     parent_label=str(k),
                 )
             )
+            if ctx.nodes_seen > ctx.limits.max_nodes:
+                # Node cap reached: the "node limit" marker is already in
+                # place, so skip the remaining siblings instead of emitting
+                # one placeholder each.
+                break
 
         base["children"] = children
-        base["child_count"] = len(items)
+        base["child_count"] = len(obj)
         base["expandable"] = True
         base["summary"] = _summarise_container(obj)
         base["preview"] = None
-        base["descendant_count"] = _count_descendants(obj)
-        base["descendant_layer_count"] = _count_remaining_layers(obj)
+        _set_descendant_counts(
+            base,
+            len(obj),
+            zip(children, (v for _, v in shown)),
+            itertools.islice(obj.values(), len(children), None),
+            ctx=ctx,
+        )
         return base
 
     if isinstance(obj, (list, tuple, set)):
-        xs = list(obj)
         if depth >= ctx.limits.max_depth:
             ctx.truncated = True
             ctx.hit = ctx.hit or "max_depth"
-            base["summary"] = _summarise_container(xs)
+            base["summary"] = _summarise_container(obj)
             base["expandable"] = True
             base["truncated"] = True
             base["truncation_reason"] = "depth limit"
-            base["child_count"] = len(xs)
-            base["descendant_count"] = _count_descendants(xs)
-            base["descendant_layer_count"] = _count_remaining_layers(xs)
+            base["child_count"] = len(obj)
+            _set_descendant_counts(base, len(obj), [], obj, ctx=ctx)
             return base
 
-        shown = xs[: ctx.limits.max_list_items]
-        if len(xs) > len(shown):
+        shown = list(itertools.islice(obj, ctx.limits.max_list_items))
+        if len(obj) > len(shown):
             ctx.truncated = True
             ctx.hit = ctx.hit or "max_list_items"
             base["truncated"] = True
@@ -330,14 +358,21 @@ def _build_node(
                     parent_label=f"[{i}]",
                 )
             )
+            if ctx.nodes_seen > ctx.limits.max_nodes:
+                break
 
         base["children"] = children
-        base["child_count"] = len(xs)
+        base["child_count"] = len(obj)
         base["expandable"] = True
-        base["summary"] = _summarise_container(xs)
+        base["summary"] = _summarise_container(obj)
         base["preview"] = None
-        base["descendant_count"] = _count_descendants(xs)
-        base["descendant_layer_count"] = _count_remaining_layers(xs)
+        _set_descendant_counts(
+            base,
+            len(obj),
+            zip(children, shown),
+            itertools.islice(obj, len(children), None),
+            ctx=ctx,
+        )
         return base
 
     if cls["node_kind"] == "scalar":
@@ -389,6 +424,7 @@ def _make_truncated_node(
         "child_count": 0,
         "descendant_count": 0,
         "descendant_layer_count": 0,
+        "descendant_count_capped": False,
         "expandable": False,
         "children": [],
         "truncated": True,
@@ -496,35 +532,78 @@ def _safe_preview(value: Any, *, max_chars: int) -> str:
     return s[:max_chars] + "…"
 
 
-def _count_descendants(obj: Any) -> int:
-    if isinstance(obj, dict):
-        total = len(obj)
-        for v in obj.values():
-            total += _count_descendants(v)
-        return total
-
-    if isinstance(obj, (list, tuple, set)):
-        total = len(obj)
-        for v in obj:
-            total += _count_descendants(v)
-        return total
+def _set_descendant_counts(
+    node: dict[str, Any],
+    child_count: int,
+    built: Iterable[tuple[dict[str, Any], Any]],
+    unbuilt: Iterable[Any],
+    *,
+    ctx: _BuildCtx,
+) -> None:
+    """
+    Fill a container node's descendant_count / descendant_layer_count.
 
-    return 0
+    Built children contribute their own counts; only values that were not
+    built (item, depth or node limits) are walked, via _count_below().
+    """
+    count = child_count
+    layers = 0
+    capped = False
+    walk: list[Iterable[Any]] = []
+    for child, value in built:
+        if child["truncation_reason"] == "node limit":
+            walk.append((value,))
+            continue
+        count += child["descendant_count"]
+        layers = max(layers, child["descendant_layer_count"])
+        capped = capped or child["descendant_count_capped"]
+    walk.append(unbuilt)
+
+    more, more_layers, more_capped = _count_below(itertools.chain(*walk), ctx=ctx)
+    node["descendant_count"] = count + more
+    node["descendant_layer_count"] = 1 + max(layers, more_layers) if child_count else 0
+    node["descendant_count_capped"] = capped or more_capped
+
+
+def _count_below(values: Iterable[Any], *, ctx: _BuildCtx) -> tuple[int, int, bool]:
+    """
+    Count the entries nested under values and the layers below the deepest one.
 
+    Visits at most ctx.count_budget values across the whole build; once it is
+    spent the counts are lower bounds and the third item is True.
+    """
+    end = object()
+    count = 0
+    layers = 0
+    stack: list[tuple[Any, int]] = [(iter(values), 0)]
+    while stack:
+        it, depth = stack[-1]
+        v = next(it, end)
+        if v is end:
+            stack.pop()
+            continue
+        if ctx.count_budget <= 0:
+            return count, layers, True
+        ctx.count_budget -= 1
+
+        if isinstance(v, dict):
+            children: Iterable[Any] = v.values()
+        elif isinstance(v, (list, tuple, set)):
+            children = v
+        else:
+            continue
+        if v:
+            count += len(v)
+            layers = max(layers, depth + 1)
+            stack.append((iter(children), depth + 1))
 
-def _count_remaining_layers(obj: Any) -> int:
-    if isinstance(obj, dict):
-        if not obj:
-            return 0
-        return 1 + max(_count_remaining_layers(v) for v in obj.values())
+    return count, layers, False
 
-    if isinstance(obj, (list, tuple, set)):
-        xs = list(obj)
-        if not xs:
-            return 0
-        return 1 + max(_count_remaining_layers(v) for v in xs)
 
-    return 0
+class _SmallFloat(float):
+    # json.dumps writes 1e-07 where orjson writes 1e-7; orjson rejects float
+    # subclasses, so build_pretty_text() takes the stdlib path for these.
+    pass
 
 
 def _to_json_compatible(obj: Any) -> Any:
@@ -537,6 +616,8 @@ def _to_json_compatible(obj: Any) -> Any:
     if isinstance(obj, float):
         if obj != obj or obj in (float("inf"), float("-inf")):
             return None
+        if obj and abs(obj) < 1e-4:
+            return _SmallFloat(obj)
         return obj
 
     if isinstance(obj, dict):
@@ -554,7 +635,9 @@ def _to_json_compatible(obj: Any) -> Any:
                         return {
                             "type": type(obj).__name__,
                             "shape": list(getattr(obj, "shape", (None, None))),
-                            "sample": sample.to_dict(orient="records"),
+                            "sample": _to_json_compatible(
+                                sample.to_dict(orient="records")
+                            ),
                         }
                     except Exception:
                         pass
@@ -609,7 +692,8 @@ def _looks_like_plot(obj: Any) -> bool:
     if Figure is not None and isinstance(obj, Figure):  # type: ignore[arg-type]
         return True
 
-    if PlotnineGGPlot is not None and isinstance(obj, PlotnineGGPlot):  # type: ignore[arg-type]
+    ggplot_type = plotnine_ggplot_type()
+    if ggplot_type is not None and isinstance(obj, ggplot_type):
         return True
 
     if hasattr(obj, "draw") and obj.__class__.__module__.startswith("plotnine"):
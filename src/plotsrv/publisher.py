@@ -1,25 +1,47 @@
 # src/plotsrv/publisher.py
 from __future__ import annotations
 
+import atexit
 import base64
+import contextlib
+import http.client
 import json
 import math
 import os
-import urllib.error
-import urllib.request
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterator
 from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
 from typing import Any, Literal
 
 import pandas as pd
 
 from . import config
-from .backends import df_to_html_simple, df_to_rich_sample, fig_to_png_bytes
+from .backends import (
+    df_to_html_simple,
+    df_to_split_sample,
+    fig_to_png_bytes,
+    plotnine_ggplot_type,
+)
 from .file_kinds import coerce_file_to_publishable
 from .json_model import build_json_document
 
 PublishMode = Literal["auto", "local", "remote"]
 
+try:  # pragma: no cover
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 try:  # pragma: no cover
     import polars as pl  # type: ignore
 except Exception:  # pragma: no cover
@@ -35,13 +57,20 @@ except Exception:  # pragma: no cover
     plt = None  # type: ignore[assignment]
     Figure = None  # type: ignore[assignment]
 
-try:  # pragma: no cover
-    from plotnine.ggplot import ggplot as PlotnineGGPlot  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    PlotnineGGPlot = None  # type: ignore[assignment]
+
+_NEVER_NA_TYPES = (str, bytes, bool, int, list, tuple, dict, set)
 
 
 def _is_na(x: Any) -> bool:
+    # Plain Python values dominate publish payloads; settle them without
+    # calling into pandas.
+    if x is None:
+        return True
+    if type(x) is float:
+        return x != x
+    if isinstance(x, _NEVER_NA_TYPES):
+        return False
+
     try:
         res = pd.isna(x)
     except Exception:
@@ -50,13 +79,8 @@ def _is_na(x: Any) -> bool:
     if isinstance(res, bool):
         return res
 
-    try:
-        import numpy as np  # type: ignore
-
-        if isinstance(res, np.bool_):  # pragma: no cover
-            return bool(res)
-    except Exception:
-        pass
+    if np is not None and isinstance(res, np.bool_):  # pragma: no cover
+        return bool(res)
 
     return False
 
@@ -65,6 +89,10 @@ def _json_safe(x: Any) -> Any:
     if x is None:
         return None
 
+    if isinstance(x, Enum):
+        # Matches orjson, which always encodes Enum members as their value.
+        return _json_safe(x.value)
+
     if isinstance(x, dict):
         return {str(k): _json_safe(v) for k, v in x.items()}
 
@@ -96,6 +124,36 @@ def _json_safe(x: Any) -> Any:
     return str(x)
 
 
+def _orjson_default(x: Any) -> Any:
+    # Called by orjson only for types it cannot encode natively (sets, pandas
+    # NA/Timestamp, dataclasses, arbitrary objects); reuse the Python walker's
+    # coercions.
+    return _json_safe(x)
+
+
+def _dumps_payload(payload: Any) -> bytes:
+    """
+    Encode a publish payload to UTF-8 JSON bytes.
+
+    With orjson installed the payload is encoded directly: NaN/Inf become null,
+    dates/datetimes ISO strings and numpy values are handled natively, so the
+    recursive _json_safe() pass is skipped. Without orjson, or when it rejects
+    a value (e.g. integers wider than 64 bits or non-str dict keys), the
+    stdlib encoder is used on the _json_safe() output. Enum members encode as
+    their value on both paths.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                default=_orjson_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            pass
+    return json.dumps(_json_safe(payload)).encode("utf-8")
+
+
 def _is_dataframe(obj: Any) -> bool:
     if isinstance(obj, pd.DataFrame):
         return True
@@ -115,6 +173,20 @@ def _to_dataframe(obj: Any) -> pd.DataFrame:
     raise TypeError(f"Expected pandas/polars DataFrame, got {type(obj)!r}")
 
 
+def _to_dataframe_head(obj: Any, max_rows: int) -> tuple[pd.DataFrame, int]:
+    """
+    Convert the first max_rows rows of a table to pandas.
+
+    Table publishes only ship a head sample, so a polars frame is sliced
+    before conversion rather than copying every row into pandas. Returns the
+    converted rows and the full row count.
+    """
+    if pl is not None and isinstance(obj, pl.DataFrame):  # type: ignore[arg-type]
+        return _to_dataframe(obj.head(max_rows)), int(obj.height)
+    df = _to_dataframe(obj)
+    return df, len(df)
+
+
 def _to_figure(obj: Any | None) -> Any:
     if plt is None:
         raise RuntimeError("matplotlib is not available; cannot publish plot")
@@ -125,7 +197,8 @@ def _to_figure(obj: Any | None) -> Any:
     if Figure is not None and isinstance(obj, Figure):  # type: ignore[arg-type]
         return obj
 
-    if PlotnineGGPlot is not None and isinstance(obj, PlotnineGGPlot):  # type: ignore[arg-type]
+    ggplot_type = plotnine_ggplot_type()
+    if ggplot_type is not None and isinstance(obj, ggplot_type):
         return obj.draw()
 
     if hasattr(obj, "draw") and obj.__class__.__module__.startswith("plotnine"):
@@ -142,7 +215,7 @@ def _infer_artifact_kind(obj: Any) -> str:
         return "text"
     if isinstance(obj, (dict, list, tuple, set)):
         return "json"
-    if _try_array_payload(obj) is not None:
+    if _is_array(obj):
         return "json"
     return "python"
 
@@ -154,7 +227,8 @@ def _looks_like_plot(obj: Any) -> bool:
     if Figure is not None and isinstance(obj, Figure):  # type: ignore[arg-type]
         return True
 
-    if PlotnineGGPlot is not None and isinstance(obj, PlotnineGGPlot):  # type: ignore[arg-type]
+    ggplot_type = plotnine_ggplot_type()
+    if ggplot_type is not None and isinstance(obj, ggplot_type):
         return True
 
     if hasattr(obj, "draw") and obj.__class__.__module__.startswith("plotnine"):
@@ -163,11 +237,23 @@ def _looks_like_plot(obj: Any) -> bool:
     return False
 
 
+def _torch_tensor_type() -> Any:
+    # torch is far too heavy to import just to run an isinstance check; if the
+    # caller has not imported it, obj cannot be a Tensor.
+    torch = sys.modules.get("torch")
+    return getattr(torch, "Tensor", None) if torch is not None else None
+
+
+def _is_array(obj: Any) -> bool:
+    if np is not None and isinstance(obj, np.ndarray):
+        return True
+    tensor_type = _torch_tensor_type()
+    return tensor_type is not None and isinstance(obj, tensor_type)
+
+
 def _try_array_payload(obj: Any) -> dict[str, Any] | None:
     try:
-        import numpy as np  # type: ignore
-
-        if isinstance(obj, np.ndarray):
+        if np is not None and isinstance(obj, np.ndarray):
             arr = obj
             payload: dict[str, Any] = {
                 "type": "numpy.ndarray",
@@ -182,8 +268,9 @@ def _try_array_payload(obj: Any) -> dict[str, Any] | None:
                 payload["data"] = arr.tolist()
                 payload["truncated"] = False
             else:
-                flat = arr.ravel()[:max_elems]
-                payload["data"] = flat.tolist()
+                # .flat slicing copies only the sampled elements; ravel() would
+                # copy the whole array when it is not contiguous.
+                payload["data"] = arr.flat[:max_elems].tolist()
                 payload["truncated"] = True
                 payload["truncation_reason"] = (
                     f"sampled first {max_elems} elements from flattened array"
@@ -193,9 +280,8 @@ def _try_array_payload(obj: Any) -> dict[str, Any] | None:
         pass
 
     try:
-        import torch  # type: ignore
-
-        if isinstance(obj, torch.Tensor):
+        tensor_type = _torch_tensor_type()
+        if tensor_type is not None and isinstance(obj, tensor_type):
             t = obj.detach()
             payload = {
                 "type": "torch.Tensor",
@@ -235,8 +321,8 @@ def _to_json_artifact_document(
     if _is_json_artifact_document(obj):
         return obj
 
-    if _try_array_payload(obj) is not None:
-        array_payload = _try_array_payload(obj)
+    array_payload = _try_array_payload(obj)
+    if array_payload is not None:
         return build_json_document(
             array_payload,
             source_format=source_format,
@@ -260,49 +346,259 @@ def _debug_enabled() -> bool:
     return os.environ.get("PLOTSRV_DEBUG", "").strip() == "1"
 
 
-def _post_publish_payload(
+_LOCAL = threading.local()
+
+
+def _get_conn(host: str, port: int) -> http.client.HTTPConnection:
+    """
+    Return this thread's keep-alive connection to (host, port).
+
+    HTTPConnection is not thread-safe, so connections are cached per thread.
+    A closed connection reopens itself on the next request.
+    """
+    conns: dict[tuple[str, int], http.client.HTTPConnection] | None = getattr(
+        _LOCAL, "conns", None
+    )
+    if conns is None:
+        conns = _LOCAL.conns = {}
+    conn = conns.get((host, port))
+    if conn is None:
+        conn = http.client.HTTPConnection(host, port, timeout=2.0)
+        conns[(host, port)] = conn
+    return conn
+
+
+def _post(host: str, port: int, data: bytes) -> tuple[int, str, bytes]:
+    """
+    POST a JSON body to /publish over a pooled connection.
+
+    Returns (status, reason, body). Transport errors are raised.
+    """
+    while True:
+        conn = _get_conn(host, port)
+        reused = conn.sock is not None
+        try:
+            conn.request(
+                "POST",
+                "/publish",
+                body=data,
+                headers={"Content-Type": "application/json"},
+            )
+            resp = conn.getresponse()
+        except (BrokenPipeError, ConnectionResetError):
+            # Includes http.client.RemoteDisconnected. The connection died
+            # before any response arrived, which is how a keep-alive socket
+            # the server dropped while idle fails; resend once on a fresh one.
+            conn.close()
+            if reused:
+                continue
+            raise
+        except (http.client.HTTPException, OSError):
+            # Timeouts and other errors: the server may already have applied
+            # the publish, so never resend.
+            conn.close()
+            raise
+
+        try:
+            return resp.status, resp.reason, resp.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            raise
+
+
+class _BackgroundSender:
+    """
+    Daemon thread that POSTs queued publish bodies via _post().
+
+    The worker thread keeps its own keep-alive connection per (host, port).
+    Failures are dropped, matching the synchronous path with PLOTSRV_DEBUG off.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[str, int, bytes]] = queue.Queue()
+        self.thread = threading.Thread(
+            target=self._run, name="plotsrv-publisher", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, host: str, port: int, data: bytes) -> None:
+        self._queue.put((host, port, data))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued publishes are sent. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            host, port, data = self._queue.get()
+            try:
+                _post(host, port, data)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+
+_SENDER: _BackgroundSender | None = None
+_SENDER_LOCK = threading.Lock()
+
+
+def _get_sender() -> _BackgroundSender:
+    global _SENDER
+    with _SENDER_LOCK:
+        if _SENDER is None:
+            _SENDER = _BackgroundSender()
+            atexit.register(_SENDER.flush)
+        return _SENDER
+
+
+def flush_publishes(timeout: float = 5.0) -> bool:
+    """
+    Block until background publishes (publish_view(..., background=True)) are sent.
+
+    Returns False if the queue did not drain within timeout seconds.
+    """
+    if _SENDER is None:
+        return True
+    return _SENDER.flush(timeout=timeout)
+
+
+def _send_publish_body(
+    data: bytes,
     *,
-    payload: dict[str, Any],
     host: str,
     port: int,
     debug: bool,
+    background: bool,
+    batched: bool = False,
 ) -> None:
-    payload = _json_safe(payload)
+    if background:
+        _get_sender().submit(host, port, data)
+        return
 
-    url = f"http://{host}:{port}/publish"
     try:
-        data = json.dumps(payload).encode("utf-8")
+        status, reason, body = _post(host, port, data)
     except Exception:
         if debug:
             raise
         return
 
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
+    if not debug:
+        return
+
+    if status >= 400:
+        raise RuntimeError(
+            f"plotsrv publish failed: {status} {reason}\n"
+            f"{body.decode('utf-8', errors='replace')}"
+        )
+
+    if batched:
+        # A batch is answered with 200 and a result per item; rejected items
+        # are only visible there.
+        results = json.loads(body).get("results", [])
+        failed = [
+            f"item {i}: {r.get('status_code')} {r.get('detail')}"
+            for i, r in enumerate(results)
+            if not r.get("ok", False)
+        ]
+        if failed:
+            raise RuntimeError("plotsrv batched publish failed:\n" + "\n".join(failed))
+
+
+def _post_publish_payload(
+    *,
+    payload: dict[str, Any],
+    host: str,
+    port: int,
+    debug: bool,
+    background: bool = False,
+) -> None:
+    pending: list[tuple[str, int, dict[str, Any]]] | None = getattr(
+        _LOCAL, "batch", None
     )
+    if pending is not None:
+        pending.append((host, port, payload))
+        return
 
     try:
-        with urllib.request.urlopen(req, timeout=2.0) as resp:
-            _ = resp.read()
-    except urllib.error.HTTPError as e:
-        if debug:
-            body = ""
-            try:
-                body = e.read().decode("utf-8", errors="replace")
-            except Exception:
-                pass
-            raise RuntimeError(
-                f"plotsrv publish failed: {e.code} {e.reason}\n{body}"
-            ) from e
-        return
+        data = _dumps_payload(payload)
     except Exception:
         if debug:
             raise
         return
 
+    _send_publish_body(
+        data, host=host, port=port, debug=debug, background=background
+    )
+
+
+def _flush_batch(
+    pending: list[tuple[str, int, dict[str, Any]]], *, background: bool
+) -> None:
+    debug = _debug_enabled()
+
+    by_target: dict[tuple[str, int], list[dict[str, Any]]] = {}
+    for host, port, payload in pending:
+        by_target.setdefault((host, port), []).append(payload)
+
+    max_items = config.get_publish_max_batch_items()
+    for (host, port), payloads in by_target.items():
+        for i in range(0, len(payloads), max_items):
+            chunk = payloads[i : i + max_items]
+            try:
+                data = _dumps_payload(chunk[0] if len(chunk) == 1 else chunk)
+            except Exception:
+                if debug:
+                    raise
+                continue
+            _send_publish_body(
+                data,
+                host=host,
+                port=port,
+                debug=debug,
+                background=background,
+                batched=len(chunk) > 1,
+            )
+
+
+@contextlib.contextmanager
+def publish_batch(*, background: bool = False) -> Iterator[None]:
+    """
+    Coalesce HTTP publish_view() calls made in this block into one POST.
+
+    Payloads are buffered per thread and sent on exit as a JSON list, one
+    request per server (split at the publish-limits max_batch_items setting).
+    The server applies them in order. Local (attached server) publishes are
+    not buffered. Nested blocks join the outermost one.
+
+        with ps.publish_batch():
+            for name, df in tables.items():
+                ps.publish_view(df, label=name, host="127.0.0.1", port=8000)
+
+    background=True hands the batched request to the background sender. If
+    the block raises, the buffered payloads are discarded and nothing is sent.
+    With PLOTSRV_DEBUG=1 an item the server rejects raises RuntimeError, as a
+    failed single publish does.
+    """
+    if getattr(_LOCAL, "batch", None) is not None:
+        yield
+        return
+
+    pending: list[tuple[str, int, dict[str, Any]]] = []
+    _LOCAL.batch = pending
+    try:
+        yield
+    finally:
+        _LOCAL.batch = None
+    _flush_batch(pending, background=background)
+
 
 def _to_publish_payload(
     obj: Any,
@@ -338,13 +634,12 @@ def _to_publish_payload(
         return payload
 
     if kind == "table":
-        df = _to_dataframe(obj)
-        payload["table"] = df_to_rich_sample(
-            df, max_rows=config.get_max_table_rows_rich()
-        )
-        payload["table_html_simple"] = df_to_html_simple(
-            df, max_rows=config.get_max_table_rows_simple()
-        )
+        max_rich = config.get_max_table_rows_rich()
+        max_simple = config.get_max_table_rows_simple()
+        df, total_rows = _to_dataframe_head(obj, max(max_rich, max_simple))
+        payload["table"] = df_to_split_sample(df, max_rows=max_rich)
+        payload["table"]["total_rows"] = total_rows
+        payload["table_html_simple"] = df_to_html_simple(df, max_rows=max_simple)
         return payload
 
     if kind == "artifact":
@@ -411,6 +706,7 @@ def _try_publish_pathlike_view(
     update_limit_s: int | None,
     force: bool,
     debug: bool,
+    background: bool = False,
 ) -> bool:
     """
     Publish a Path-like object if obj is a real filesystem path.
@@ -449,6 +745,7 @@ def _try_publish_pathlike_view(
                 view_id=view_id,
                 update_limit_s=update_limit_s,
                 force=force,
+                background=background,
                 kind="table",
             )
             return True
@@ -467,6 +764,7 @@ def _try_publish_pathlike_view(
                 artifact_kind="html",
                 update_limit_s=update_limit_s,
                 force=force,
+                background=background,
                 kind="artifact",
             )
             return True
@@ -494,6 +792,7 @@ def _try_publish_pathlike_view(
                 artifact_kind="json",
                 update_limit_s=update_limit_s,
                 force=force,
+                background=background,
                 kind="artifact",
             )
             return True
@@ -509,6 +808,7 @@ def _try_publish_pathlike_view(
             artifact_kind=ak,
             update_limit_s=update_limit_s,
             force=force,
+            background=background,
             kind="artifact",
         )
         return True
@@ -528,6 +828,7 @@ def _try_publish_pathlike_view(
             artifact_kind="text",
             update_limit_s=update_limit_s,
             force=force,
+            background=background,
             kind="artifact",
         )
         return True
@@ -611,6 +912,8 @@ def _publish_view_local(
     view_id: str | None,
     kind: str | None,
     artifact_kind: str | None,
+    update_limit_s: int | None = None,
+    force: bool = False,
 ) -> None:
     """
     Publish directly into the in-process plotsrv server/store.
@@ -636,6 +939,8 @@ def _publish_view_local(
         view_id=view_id,
         kind=kind,
         artifact_kind=artifact_kind,
+        update_limit_s=update_limit_s,
+        force=force,
     )
 
 
@@ -653,6 +958,7 @@ def publish_view(
     force: bool = False,
     kind: str | None = None,
     artifact_kind: str | None = None,
+    background: bool = False,
 ) -> None:
     """
     Publish an object as a plotsrv browser view.
@@ -673,6 +979,11 @@ def publish_view(
     This accepts anything plotsrv knows how to display: plots, tables, text,
     JSON-like objects, markdown, HTML payloads, images, path-like files, and
     generic Python objects.
+
+    background=True hands HTTP publishes to a daemon sender thread that reuses
+    one connection per server, so the call returns without waiting on the
+    round-trip. Errors are not raised in this mode; use flush_publishes() to
+    wait for the queue to drain. Local (attached server) publishes ignore it.
     """
     debug = _debug_enabled()
 
@@ -702,6 +1013,7 @@ def publish_view(
         update_limit_s=update_limit_s,
         force=force,
         debug=debug,
+        background=background,
     ):
         return
 
@@ -716,6 +1028,8 @@ def publish_view(
                 view_id=view_id,
                 kind=kind,
                 artifact_kind=artifact_kind,
+                update_limit_s=update_limit_s,
+                force=force,
             )
         except RuntimeError as e:
             if "plotsrv server already running" in str(e):
@@ -758,4 +1072,5 @@ def publish_view(
         host=remote_host,
         port=remote_port,
         debug=debug,
+        background=background,
     )
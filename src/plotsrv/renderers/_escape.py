@@ -0,0 +1,25 @@
+# src/plotsrv/renderers/_escape.py
+from __future__ import annotations
+
+
+def escape_html(s: object) -> str:
+    """
+    Escape text for HTML element content and quoted attribute values.
+
+    A chain of str.replace calls rather than str.translate: on the short
+    strings renderers escape, translate with multi-character replacements is
+    several times slower.
+    """
+    return (
+        str(s)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+
+
+def escape_attr(s: object) -> str:
+    """Like escape_html(), but also flattens newlines for attribute values."""
+    return escape_html(s).replace("\n", " ").replace("\r", " ")
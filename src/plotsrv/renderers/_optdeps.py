@@ -0,0 +1,41 @@
+# src/plotsrv/renderers/_optdeps.py
+from __future__ import annotations
+
+import functools
+import importlib.util
+import sys
+from typing import Any
+
+
+@functools.lru_cache(maxsize=None)
+def has(name: str) -> bool:
+    """
+    Whether an optional dependency is installed, without importing it.
+
+    The answer is cached per process, so a missing package costs one
+    find_spec probe rather than a failed import (and its traceback) per render.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def optional_module(name: str) -> Any | None:
+    """
+    Return an optional dependency (e.g. "bleach", "markdown"), or None.
+
+    sys.modules is consulted first, so after the first successful import each
+    call is a dict lookup rather than a trip through the import system. A
+    module installed there (such as a test fake) also takes precedence.
+    """
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    if not has(name):
+        return None
+    try:
+        # builtins.__import__ rather than importlib, so import hooks apply.
+        return __import__(name)
+    except Exception:
+        return None
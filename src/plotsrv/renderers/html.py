@@ -6,6 +6,8 @@ import re
 
 from .. import config
 from ..artifacts import Truncation
+from ._escape import escape_html
+from ._optdeps import optional_module
 from .base import RenderResult, Renderer
 from .limits import truncate_text
 
@@ -14,6 +16,48 @@ _HEAD_CLOSE_RE = re.compile(r"(?is)</head\s*>")
 _BODY_OPEN_RE = re.compile(r"(?is)<body\b[^>]*>")
 _HTML_OPEN_RE = re.compile(r"(?is)<html\b[^>]*>")
 
+# bleach allow-lists, built once rather than on every sanitize call.
+_ALLOWED_TAGS = frozenset(
+    {
+        "p",
+        "br",
+        "hr",
+        "b",
+        "strong",
+        "i",
+        "em",
+        "u",
+        "blockquote",
+        "pre",
+        "code",
+        "ul",
+        "ol",
+        "li",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "table",
+        "thead",
+        "tbody",
+        "tr",
+        "th",
+        "td",
+        "a",
+        "span",
+        "div",
+        "img",
+    }
+)
+_ALLOWED_ATTRS: dict[str, list[str]] = {
+    "a": ["href", "title", "target", "rel"],
+    "img": ["src", "alt", "title", "width", "height"],
+    "*": ["class"],
+}
+_ALLOWED_PROTOCOLS = frozenset({"http", "https", "mailto", "data"})
+
 
 _DISPLAY_ONLY_SCRIPT = r"""
 <script>
@@ -89,16 +133,6 @@ _DISPLAY_ONLY_STYLE = r"""
 """.strip()
 
 
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
-
-
 def _escape_srcdoc(s: str) -> str:
     return s.replace("&", "&amp;").replace('"', "&quot;")
 
@@ -141,62 +175,25 @@ def _sanitize_html(html: str) -> tuple[str, bool]:
     Best-effort sanitization.
     Returns (sanitized_html, used_bleach?).
     """
-    try:
-        import bleach  # type: ignore
-
-        allowed_tags = [
-            "p",
-            "br",
-            "hr",
-            "b",
-            "strong",
-            "i",
-            "em",
-            "u",
-            "blockquote",
-            "pre",
-            "code",
-            "ul",
-            "ol",
-            "li",
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",
-            "table",
-            "thead",
-            "tbody",
-            "tr",
-            "th",
-            "td",
-            "a",
-            "span",
-            "div",
-            "img",
-        ]
-        allowed_attrs = {
-            "a": ["href", "title", "target", "rel"],
-            "img": ["src", "alt", "title", "width", "height"],
-            "*": ["class"],
-        }
-        allowed_protocols = ["http", "https", "mailto", "data"]
+    bleach = optional_module("bleach")
+    if bleach is None:
+        return escape_html(html), False
 
+    try:
         html = strip_style_and_script_blocks(html)
 
         cleaned = bleach.clean(
             html,
-            tags=allowed_tags,
-            attributes=allowed_attrs,
-            protocols=allowed_protocols,
+            tags=_ALLOWED_TAGS,
+            attributes=_ALLOWED_ATTRS,
+            protocols=_ALLOWED_PROTOCOLS,
             strip=True,
         )
 
         cleaned = bleach.linkify(cleaned, callbacks=[bleach.callbacks.nofollow])
         return cleaned, True
     except Exception:
-        return _escape_html(html), False
+        return escape_html(html), False
 
 
 def _iframe_html(
@@ -213,7 +210,7 @@ def _iframe_html(
     return f"""
     <div class="plotsrv-html-iframe-wrap" data-plotsrv-html-frame="{mode_attr}">
       <iframe class="plotsrv-html-iframe"
-              sandbox="{_escape_html(sandbox)}"
+              sandbox="{escape_html(sandbox)}"
               srcdoc="{srcdoc}">
       </iframe>
     </div>
@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from ._escape import escape_attr, escape_html
 from .base import RenderResult, Renderer
 
 _SAFE_IMAGE_MIME_RE = re.compile(
@@ -13,20 +14,13 @@ _SAFE_IMAGE_MIME_RE = re.compile(
 
 _SAFE_B64_RE = re.compile(r"^[A-Za-z0-9+/=\s_-]*$")
 
-
-def _escape_html(s: str) -> str:
-    return (
-        str(s)
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
-
-
-def _escape_attr(s: str) -> str:
-    return _escape_html(s).replace("\n", " ").replace("\r", " ")
+_FILENAME_HTML = "<div style='opacity:0.7'>{filename}</div>"
+_IMAGE_HTML = (
+    "<div style='display:flex;flex-direction:column;gap:8px'>"
+    "{filename_html}"
+    "<img src='data:{mime};base64,{data_b64}' style='max-width:100%;height:auto' />"
+    "</div>"
+)
 
 
 def _safe_image_mime(raw: Any) -> str:
@@ -57,15 +51,12 @@ class ImageRenderer(Renderer):
 
         filename_html = ""
         if filename:
-            filename_html = (
-                f"<div style='opacity:0.7'>{_escape_html(str(filename))}</div>"
-            )
-
-        html = (
-            "<div style='display:flex;flex-direction:column;gap:8px'>"
-            + filename_html
-            + f"<img src='data:{_escape_attr(mime)};base64,{_escape_attr(data_b64)}' style='max-width:100%;height:auto' />"
-            + "</div>"
+            filename_html = _FILENAME_HTML.format(filename=escape_html(str(filename)))
+
+        html = _IMAGE_HTML.format(
+            filename_html=filename_html,
+            mime=escape_attr(mime),
+            data_b64=escape_attr(data_b64),
         )
 
         return RenderResult(
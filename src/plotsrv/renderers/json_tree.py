@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Iterator
 from typing import Any
 
+from ._escape import escape_attr, escape_html
 from .base import RenderResult
 from .limits import DEFAULT_JSON_LIMITS, JsonLimits
 from ..artifacts import Truncation
@@ -22,6 +24,14 @@ _ICON_SRC = {
     "exception": "/static/logo_exception.png",  # legacy alias
 }
 
+# Static fragments emitted around child nodes; kept as constants so the node
+# walkers only append to a shared parts list instead of re-concatenating the
+# whole subtree at every level.
+_LI_OPEN = "<li>"
+_LI_CLOSE = "</li>"
+_RICH_CHILDREN_CLOSE = "\n      </ul>\n    </details>"
+_SIMPLE_CHILDREN_CLOSE = "</ul>\n    </details>"
+
 
 def _to_json_model_limits(limits: JsonLimits) -> JsonModelLimits:
     return JsonModelLimits(
@@ -62,7 +72,7 @@ class JsonTreeRenderer:
         if not isinstance(root, dict):
             html = (
                 "<div class='note'>Invalid JSON document payload.</div>"
-                f"<pre class='plotsrv-pre plotsrv-pre--wrap'>{_escape_html(repr(obj))}</pre>"
+                f"<pre class='plotsrv-pre plotsrv-pre--wrap'>{escape_html(repr(obj))}</pre>"
             )
             return RenderResult(
                 kind="json",
@@ -71,7 +81,9 @@ class JsonTreeRenderer:
                 meta={"view_id": view_id, "invalid_document": True},
             )
 
-        rich_tree_html = _render_document_node(root)
+        rich_parts: list[str] = []
+        _emit_tree(root, rich_parts.append, _open_document_node)
+        rich_tree_html = "".join(rich_parts)
         rich_head_html = """
         <div class="ps-json-rich-head" aria-hidden="true">
           <div class="ps-json-rich-head__cell">Key</div>
@@ -83,7 +95,9 @@ class JsonTreeRenderer:
         </div>
         """.strip()
 
-        simple_html = _render_simple_document_node(root)
+        simple_parts: list[str] = []
+        _emit_tree(root, simple_parts.append, _open_simple_document_node)
+        simple_html = "".join(simple_parts)
 
         text_value = raw_text if isinstance(raw_text, str) else pretty_text
         if not isinstance(text_value, str):
@@ -146,13 +160,13 @@ class JsonTreeRenderer:
         </div>
         """.strip()
 
-        raw_text_json = _escape_attr(
+        raw_text_json = escape_attr(
             json.dumps(raw_text) if raw_text is not None else "null"
         )
-        pretty_text_json = _escape_attr(
+        pretty_text_json = escape_attr(
             json.dumps(pretty_text) if pretty_text is not None else "null"
         )
-        source_format_attr = _escape_attr(str(source_format or "python_object"))
+        source_format_attr = escape_attr(str(source_format or "python_object"))
 
         html = f"""
         {toolbar}
@@ -177,7 +191,7 @@ class JsonTreeRenderer:
           </div>
 
           <div class="ps-json-panel ps-json-panel--text" data-json-panel="text" hidden>
-            <pre class="plotsrv-pre plotsrv-pre--wrap ps-json-textview" data-json-text-view="1">{_escape_html(text_value)}</pre>
+            <pre class="plotsrv-pre plotsrv-pre--wrap ps-json-textview" data-json-text-view="1">{escape_html(text_value)}</pre>
           </div>
 
           <div class="ps-json-pinnedmodal" data-json-pinned-modal="1" hidden>
@@ -217,7 +231,9 @@ class JsonTreeRenderer:
         return self._render_document_payload(doc, view_id=view_id)
 
 
-def _render_document_node(node: dict[str, Any]) -> str:
+def _open_document_node(
+    node: dict[str, Any], emit: Callable[[str], None]
+) -> tuple[list[Any], str] | None:
     path = _node_path(node)
     display_key = str(node.get("display_key") or "")
     type_label = str(node.get("type_label") or "")
@@ -233,6 +249,7 @@ def _render_document_node(node: dict[str, Any]) -> str:
     value_kind = str(node.get("value_kind") or "value")
     desc_count = int(node.get("descendant_count") or 0)
     desc_layers = int(node.get("descendant_layer_count") or 0)
+    desc_capped = bool(node.get("descendant_count_capped") or False)
     expandable = bool(node.get("expandable") or False)
     children = node.get("children") if isinstance(node.get("children"), list) else []
     truncated = bool(node.get("truncated") or False)
@@ -263,13 +280,13 @@ def _render_document_node(node: dict[str, Any]) -> str:
     show_summary = bool(summary) and expandable
 
     summary_html = (
-        f'<span class="ps-json-cell ps-json-cell--summary" data-json-text="{_escape_attr(str(summary))}">({_escape_html(str(summary))})</span>'
+        f'<span class="ps-json-cell ps-json-cell--summary" data-json-text="{escape_attr(str(summary))}">({escape_html(str(summary))})</span>'
         if show_summary
         else '<span class="ps-json-cell ps-json-cell--summary"></span>'
     )
 
     type_html = (
-        f'<span class="ps-json-cell ps-json-cell--type" data-json-text="{_escape_attr(type_label)}">{icon_html}<span class="ps-json-typelabel">{_escape_html(type_label)}</span></span>'
+        f'<span class="ps-json-cell ps-json-cell--type" data-json-text="{escape_attr(type_label)}">{icon_html}<span class="ps-json-typelabel">{escape_html(type_label)}</span></span>'
         if type_label
         else '<span class="ps-json-cell ps-json-cell--type"></span>'
     )
@@ -286,9 +303,11 @@ def _render_document_node(node: dict[str, Any]) -> str:
             if desc_count == 1
             else f"{desc_count} nested entries"
         )
+        if desc_capped:
+            entry_text = f"{desc_count}+ nested entries"
         hint_html = (
             '<span class="ps-json-cell ps-json-cell--hint">'
-            + _escape_html(more_text + ", " + entry_text + " total")
+            + escape_html(more_text + ", " + entry_text + " total")
             + "</span>"
         )
 
@@ -296,16 +315,16 @@ def _render_document_node(node: dict[str, Any]) -> str:
     if preview and node_kind != "container":
         value_html = (
             f'<span class="ps-json-cell ps-json-cell--value" '
-            f'data-json-text="{_escape_attr(str(preview))}" '
-            f'title="{_escape_attr(str(full_value or preview))}">'
-            f"{_escape_html(str(preview))}</span>"
+            f'data-json-text="{escape_attr(str(preview))}" '
+            f'title="{escape_attr(str(full_value or preview))}">'
+            f"{escape_html(str(preview))}</span>"
         )
 
     actions_html = '<span class="ps-json-cell ps-json-cell--actions"></span>'
     if not expandable:
         pin_btn = (
             f'<button type="button" class="ps-json-actionbtn ps-json-actionbtn--pin" '
-            f'data-json-pin-toggle="{_escape_attr(path)}" '
+            f'data-json-pin-toggle="{escape_attr(path)}" '
             f'aria-pressed="false" title="Pin value">📌</button>'
         )
         actions_html = (
@@ -315,7 +334,7 @@ def _render_document_node(node: dict[str, Any]) -> str:
     trunc_html = ""
     if truncated:
         reason_raw = str(truncation_reason or "truncated")
-        reason = _escape_html(reason_raw)
+        reason = escape_html(reason_raw)
 
         if reason_raw == "dict item limit":
             badge_text = "… more keys"
@@ -332,14 +351,14 @@ def _render_document_node(node: dict[str, Any]) -> str:
 
         trunc_html = (
             f'<span class="badge json-badge" title="{reason}">'
-            f"{_escape_html(badge_text)}"
+            f"{escape_html(badge_text)}"
             f"</span>"
         )
 
     lead_html = f"""
     <span class="ps-json-cell ps-json-cell--lead">
       <span class="{toggle_class}" aria-hidden="true"></span>
-      <span class="ps-json-key" data-json-text="{_escape_attr(display_key)}">{_escape_html(display_key)}</span>
+      <span class="ps-json-key" data-json-text="{escape_attr(display_key)}">{escape_html(display_key)}</span>
       {trunc_html}
     </span>
     """.strip()
@@ -356,44 +375,47 @@ def _render_document_node(node: dict[str, Any]) -> str:
     if not expandable:
         full_value_text = str(full_value if full_value is not None else "")
 
-        return f"""
+        emit(
+            f"""
         <div class="ps-json-entry ps-json-entry--scalar"
-             data-json-path="{_escape_attr(path)}"
+             data-json-path="{escape_attr(path)}"
              data-json-depth="{depth}"
-             data-json-key="{_escape_attr(display_key)}"
-             data-json-full-value="{_escape_attr(full_value_text)}">
-          <div class="ps-json-row ps-json-row--leaf ps-json-row--{_escape_attr(value_kind)}"
+             data-json-key="{escape_attr(display_key)}"
+             data-json-full-value="{escape_attr(full_value_text)}">
+          <div class="ps-json-row ps-json-row--leaf ps-json-row--{escape_attr(value_kind)}"
                data-json-depth="{depth}"
-               data-json-path="{_escape_attr(path)}"
-               data-json-text="{_escape_attr(row_text)}">
+               data-json-path="{escape_attr(path)}"
+               data-json-text="{escape_attr(row_text)}">
             {row_inner}
           </div>
-          <pre hidden data-json-full-value-text="1">{_escape_html(full_value_text)}</pre>
+          <pre hidden data-json-full-value-text="1">{escape_html(full_value_text)}</pre>
         </div>
         """.strip()
+        )
+        return None
 
-    children_html = "".join(f"<li>{_render_document_node(ch)}</li>" for ch in children)
-
-    return f"""
+    emit(
+        f"""
     <details open
-             class="ps-json-node ps-json-node--{_escape_attr(value_kind)}"
+             class="ps-json-node ps-json-node--{escape_attr(value_kind)}"
              data-json-depth="{depth}"
              data-json-expandable="1"
-             data-json-path="{_escape_attr(path)}">
-      <summary class="ps-json-row ps-json-row--container ps-json-row--{_escape_attr(value_kind)}"
+             data-json-path="{escape_attr(path)}">
+      <summary class="ps-json-row ps-json-row--container ps-json-row--{escape_attr(value_kind)}"
                data-json-depth="{depth}"
-               data-json-path="{_escape_attr(path)}"
-               data-json-text="{_escape_attr(row_text)}">
+               data-json-path="{escape_attr(path)}"
+               data-json-text="{escape_attr(row_text)}">
         {row_inner}
       </summary>
       <ul class="ps-json-children">
-        {children_html}
-      </ul>
-    </details>
-    """.strip()
+        """.lstrip()
+    )
+    return children, _RICH_CHILDREN_CLOSE
 
 
-def _render_simple_document_node(node: dict[str, Any]) -> str:
+def _open_simple_document_node(
+    node: dict[str, Any], emit: Callable[[str], None]
+) -> tuple[list[Any], str] | None:
     path = _node_path(node)
     display_key = str(node.get("display_key") or "")
     type_label = str(node.get("type_label") or "")
@@ -404,43 +426,82 @@ def _render_simple_document_node(node: dict[str, Any]) -> str:
     depth = int(node.get("depth") or 0)
 
     bits: list[str] = [
-        f'<span class="json-key" data-json-text="{_escape_attr(display_key)}">{_escape_html(display_key)}</span>'
+        f'<span class="json-key" data-json-text="{escape_attr(display_key)}">{escape_html(display_key)}</span>'
     ]
 
     if preview and not expandable:
         bits.append(
-            f'<span class="json-val" data-json-text="{_escape_attr(str(preview))}">{_escape_html(str(preview))}</span>'
+            f'<span class="json-val" data-json-text="{escape_attr(str(preview))}">{escape_html(str(preview))}</span>'
         )
     else:
         if summary:
             bits.append(
-                f'<span class="json-summary" data-json-text="{_escape_attr(str(summary))}">({_escape_html(str(summary))})</span>'
+                f'<span class="json-summary" data-json-text="{escape_attr(str(summary))}">({escape_html(str(summary))})</span>'
             )
         if type_label:
             bits.append(
-                f'<span class="json-type-label">{_escape_html(type_label)}</span>'
+                f'<span class="json-type-label">{escape_html(type_label)}</span>'
             )
 
     summaryline = " ".join(bits)
 
     if not expandable:
-        return (
+        emit(
             f'<div class="json-scalar" data-json-depth="{depth}" '
-            f'data-json-path="{_escape_attr(path)}">{summaryline}</div>'
+            f'data-json-path="{escape_attr(path)}">{summaryline}</div>'
         )
+        return None
 
-    inner_html = "".join(
-        f"<li>{_render_simple_document_node(ch)}</li>" for ch in children
-    )
-
-    return f"""
+    emit(
+        f"""
     <details open class="json-node json-node--simple"
              data-json-depth="{depth}"
-             data-json-path="{_escape_attr(path)}">
+             data-json-path="{escape_attr(path)}">
       <summary class="json-summaryline">{summaryline}</summary>
-      <ul class="json-children">{inner_html}</ul>
-    </details>
-    """.strip()
+      <ul class="json-children">""".lstrip()
+    )
+    return children, _SIMPLE_CHILDREN_CLOSE
+
+
+_OpenNode = Callable[
+    [dict[str, Any], Callable[[str], None]], tuple[list[Any], str] | None
+]
+
+
+def _emit_tree(
+    root: dict[str, Any], emit: Callable[[str], None], open_node: _OpenNode
+) -> None:
+    """
+    Walk a document tree depth-first without recursion.
+
+    ``open_node`` emits a node's own markup and, for containers, returns the
+    children still to be walked plus the fragment that closes the container.
+    Deeply nested documents therefore never approach the recursion limit.
+    """
+    opened = open_node(root, emit)
+    if opened is None:
+        return
+
+    children, close = opened
+    stack: list[tuple[Iterator[Any], str]] = [(iter(children), close)]
+    push = stack.append
+    pop = stack.pop
+    done = object()
+
+    while stack:
+        it, close = stack[-1]
+        ch = next(it, done)
+        if ch is done:
+            pop()
+            emit(close)
+            continue
+
+        emit(_LI_OPEN)
+        opened = open_node(ch, emit)
+        if opened is None:
+            emit(_LI_CLOSE)
+        else:
+            push((iter(opened[0]), opened[1] + _LI_CLOSE))
 
 
 def _node_path(node: dict[str, Any]) -> str:
@@ -473,18 +534,3 @@ def _pretty_json_fallback(obj: Any) -> str:
             return repr(obj)
         except Exception:
             return "<unrepresentable>"
-
-
-def _escape_html(s: str) -> str:
-    return (
-        str(s)
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
-
-
-def _escape_attr(s: str) -> str:
-    return _escape_html(s).replace("\n", " ").replace("\r", " ")
@@ -32,6 +32,12 @@ def truncate_text(
     anchor: Literal["head", "tail"] = "head",
 ) -> tuple[str, Truncation]:
     original_chars = len(text)
+    max_chars = max(1, int(limits.max_chars))
+
+    # Common case: already within limits, so skip line splitting entirely.
+    if limits.max_lines is None and original_chars <= max_chars:
+        return text, Truncation(truncated=False)
+
     out = text
     details: dict[str, Any] = {"original_chars": original_chars, "anchor": anchor}
 
@@ -51,7 +57,6 @@ def truncate_text(
             details["original_lines"] = len(lines)
             details["truncated_by"] = "max_lines"
 
-    max_chars = max(1, int(limits.max_chars))
     if len(out) > max_chars:
         if anchor == "tail":
             out = out[-max_chars:]
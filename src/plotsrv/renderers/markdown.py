@@ -5,18 +5,60 @@ from typing import Any
 
 from .. import config
 from ..artifacts import Truncation
+from ._escape import escape_html
+from ._optdeps import optional_module
 from .base import RenderResult, Renderer
 from .limits import TextLimits, truncate_text
 
+_MD_EXTENSIONS = ("fenced_code", "tables")
 
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+# bleach allow-lists, built once rather than on every sanitize call.
+_ALLOWED_TAGS = frozenset(
+    {
+        "a",
+        "p",
+        "br",
+        "hr",
+        "blockquote",
+        "strong",
+        "em",
+        "code",
+        "pre",
+        "kbd",
+        "samp",
+        "var",
+        "ul",
+        "ol",
+        "li",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "table",
+        "thead",
+        "tbody",
+        "tr",
+        "th",
+        "td",
+        "span",
+        "div",
+        "img",
+    }
+)
+_ALLOWED_ATTRS: dict[str, list[str]] = {
+    "a": ["href", "title", "rel", "target"],
+    "img": ["src", "alt", "title", "width", "height"],
+    "th": ["colspan", "rowspan"],
+    "td": ["colspan", "rowspan"],
+    "span": ["class"],
+    "div": ["class"],
+    "code": ["class"],
+    "pre": ["class"],
+    "table": ["class"],
+}
+_ALLOWED_PROTOCOLS = frozenset({"http", "https", "mailto", "data"})
 
 
 def _escape_srcdoc(s: str) -> str:
@@ -44,75 +86,26 @@ def _coerce_markdown_obj(obj: Any) -> tuple[str, bool, str | None]:
 
 
 def _render_markdown_to_html(text: str) -> str:
-    try:
-        import markdown  # type: ignore
+    markdown = optional_module("markdown")
+    if markdown is None:
+        raise ImportError("markdown is not installed")
 
-        return markdown.markdown(text, extensions=["fenced_code", "tables"])
-    except Exception:
-        raise
+    return markdown.markdown(text, extensions=_MD_EXTENSIONS)
 
 
 def _sanitize_html(html: str) -> tuple[str, bool, str | None]:
     """
     Returns (sanitized_html, sanitized?, note_if_any)
     """
-    try:
-        import bleach  # type: ignore
-    except Exception:
+    bleach = optional_module("bleach")
+    if bleach is None:
         return html, False, "install 'bleach' to enable safe markdown sanitization"
 
-    allowed_tags = [
-        "a",
-        "p",
-        "br",
-        "hr",
-        "blockquote",
-        "strong",
-        "em",
-        "code",
-        "pre",
-        "kbd",
-        "samp",
-        "var",
-        "ul",
-        "ol",
-        "li",
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-        "table",
-        "thead",
-        "tbody",
-        "tr",
-        "th",
-        "td",
-        "span",
-        "div",
-        "img",
-    ]
-
-    allowed_attrs: dict[str, list[str]] = {
-        "a": ["href", "title", "rel", "target"],
-        "img": ["src", "alt", "title", "width", "height"],
-        "th": ["colspan", "rowspan"],
-        "td": ["colspan", "rowspan"],
-        "span": ["class"],
-        "div": ["class"],
-        "code": ["class"],
-        "pre": ["class"],
-        "table": ["class"],
-    }
-
-    allowed_protocols = ["http", "https", "mailto", "data"]
-
     cleaned = bleach.clean(
         html,
-        tags=allowed_tags,
-        attributes=allowed_attrs,
-        protocols=allowed_protocols,
+        tags=_ALLOWED_TAGS,
+        attributes=_ALLOWED_ATTRS,
+        protocols=_ALLOWED_PROTOCOLS,
         strip=True,
     )
 
@@ -192,7 +185,7 @@ def _iframe_html(
       </div>
       <div class="plotsrv-markdown-iframe-wrap">
         <iframe class="plotsrv-markdown-iframe"
-                sandbox="{_escape_html(sandbox)}"
+                sandbox="{escape_html(sandbox)}"
                 srcdoc="{_escape_srcdoc(srcdoc)}">
         </iframe>
       </div>
@@ -227,8 +220,8 @@ class MarkdownRenderer(Renderer):
             html = (
                 "<div class='plotsrv-markdown plotsrv-markdown--fallback'>"
                 f"<div class='artifact-warn'>Markdown render failed: "
-                f"{_escape_html(type(e).__name__)}: {_escape_html(str(e))}</div>"
-                f"<pre class='plotsrv-markdown__raw'>{_escape_html(text2)}</pre>"
+                f"{escape_html(type(e).__name__)}: {escape_html(str(e))}</div>"
+                f"<pre class='plotsrv-markdown__raw'>{escape_html(text2)}</pre>"
                 "</div>"
             )
             return RenderResult(
@@ -281,9 +274,9 @@ class MarkdownRenderer(Renderer):
                 "<div class='artifact-warn'>"
                 "Markdown sanitization is not available. "
                 "Showing raw markdown escaped. "
-                f"{_escape_html(meta_note)}"
+                f"{escape_html(meta_note)}"
                 "</div>"
-                f"<pre class='plotsrv-markdown__raw'>{_escape_html(text2)}</pre>"
+                f"<pre class='plotsrv-markdown__raw'>{escape_html(text2)}</pre>"
                 "</div>"
             )
             return RenderResult(
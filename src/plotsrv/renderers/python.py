@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from ._escape import escape_html
 from .base import Renderer, RenderResult
 
 
@@ -37,7 +38,7 @@ class PythonRenderer(Renderer):
           <pre class="ps-code ps-code-pre"
                data-plotsrv-code-pre="1"
                data-plotsrv-code-language="python"><code class="language-python"
-               data-plotsrv-code-content="1">{_escape_html(code)}</code></pre>
+               data-plotsrv-code-content="1">{escape_html(code)}</code></pre>
         </div>
         """.strip()
 
@@ -47,13 +48,3 @@ class PythonRenderer(Renderer):
             mime="text/html",
             meta={"view_id": view_id},
         )
-
-
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
@@ -1,11 +1,34 @@
 # src/plotsrv/renderers/registry.py
 from __future__ import annotations
 
+import re
+import reprlib
 from typing import Any
 
+from ._escape import escape_html
 from .base import Renderer, RenderResult
 
 _RENDERERS: list[Renderer] = []
+# Kinds are unique in _RENDERERS (see register_renderer), so this index gives
+# O(1) lookups for kind hints and the string safety ordering.
+_BY_KIND: dict[str, Renderer] = {}
+
+
+_STRING_PREFERRED_KINDS = ("python", "traceback", "text", "json")
+
+# Budgeted repr for the no-renderer fallback: large containers are summarised
+# ("[1, 2, ...]") instead of being repr'd in full and then thrown away.
+_FALLBACK_REPR = reprlib.Repr()
+_FALLBACK_REPR.maxstring = 2000
+_FALLBACK_REPR.maxother = 2000
+_FALLBACK_REPR.maxlong = 2000
+_FALLBACK_REPR.maxdict = 64
+_FALLBACK_REPR.maxlist = 64
+_FALLBACK_REPR.maxtuple = 64
+_FALLBACK_REPR.maxset = 64
+_FALLBACK_REPR.maxfrozenset = 64
+_FALLBACK_REPR.maxdeque = 64
+_FALLBACK_REPR.maxarray = 64
 
 
 def register_renderer(r: Renderer) -> None:
@@ -24,6 +47,7 @@ def register_renderer(r: Renderer) -> None:
             for existing in _RENDERERS
             if getattr(existing, "kind", None) != kind
         ]
+        _BY_KIND[kind] = r
 
     _RENDERERS.append(r)
 
@@ -35,6 +59,7 @@ def clear_renderers() -> None:
     Mainly useful for tests.
     """
     _RENDERERS.clear()
+    _BY_KIND.clear()
 
 
 def choose_renderer(obj: Any, *, kind_hint: str | None = None) -> Renderer | None:
@@ -49,27 +74,23 @@ def choose_renderer(obj: Any, *, kind_hint: str | None = None) -> Renderer | Non
     """
     # 1) Honour explicit hint first
     if kind_hint:
-        for r in _RENDERERS:
-            if getattr(r, "kind", None) == kind_hint and r.can_render(obj):
-                return r
+        r = _BY_KIND.get(kind_hint)
+        if r is not None and r.can_render(obj):
+            return r
 
     # 2) Safety ordering for strings when no hint:
     #    avoid "any str => HTML" behaviour.
     if isinstance(obj, str):
-        htmlish = _looks_like_html(obj)
-
         # Prefer code/text-ish renderers first
-        preferred_kinds = ("python", "traceback", "text", "json")
-        for k in preferred_kinds:
-            for r in _RENDERERS:
-                if getattr(r, "kind", None) == k and r.can_render(obj):
-                    return r
+        for k in _STRING_PREFERRED_KINDS:
+            r = _BY_KIND.get(k)
+            if r is not None and r.can_render(obj):
+                return r
 
         # Only let HTML renderers win if it actually looks like HTML
-        if htmlish:
-            for r in _RENDERERS:
-                if getattr(r, "kind", None) == "html" and r.can_render(obj):
-                    return r
+        r = _BY_KIND.get("html")
+        if r is not None and _looks_like_html(obj) and r.can_render(obj):
+            return r
 
         # Fall back to first match (but still avoid html if not htmlish)
         for r in _RENDERERS:
@@ -94,50 +115,28 @@ def choose_renderer(obj: Any, *, kind_hint: str | None = None) -> Renderer | Non
 def render_any(obj: Any, *, view_id: str, kind_hint: str | None = None) -> RenderResult:
     r = choose_renderer(obj, kind_hint=kind_hint)
     if r is None:
-        # fallback: repr
+        # fallback: bounded repr
         from ..artifacts import Truncation
 
         return RenderResult(
             kind="text",
-            html=f"<pre>{_escape_html(repr(obj))}</pre>",
+            html=f"<pre>{escape_html(_FALLBACK_REPR.repr(obj))}</pre>",
             truncation=Truncation(truncated=False),
             meta={"fallback": True},
         )
     return r.render(obj, view_id=view_id)
 
 
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+# Leading whitespace, then "<" followed by a letter or "!doctype", with the tag
+# closed within the first 2000 characters after the whitespace.
+_HTMLISH_RE = re.compile(r"\s*<(?=[^\W\d_]|!doctype)[^>]{0,1998}>", re.IGNORECASE)
 
 
 def _looks_like_html(s: str) -> bool:
     """
     Conservative heuristic: only treat as HTML if it starts with a tag-ish token.
+
+    A single anchored regex match, so no stripped or lowered copy of the
+    string is made.
     """
-    t = s.lstrip()
-    if not t.startswith("<"):
-        return False
-    head = t[:2000]
-    # must contain a close angle bracket early-ish
-    if ">" not in head:
-        return False
-    # common tag-ish starters
-    starters = (
-        "<!doctype",
-        "<html",
-        "<div",
-        "<span",
-        "<p",
-        "<pre",
-        "<code",
-        "<table",
-        "<details",
-        "<summary",
-    )
-    return head.lower().startswith(starters) or head[1:2].isalpha()
+    return _HTMLISH_RE.match(s) is not None
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 from .. import config
+from ._escape import escape_html
 from .base import RenderResult
 from .limits import TextLimits, truncate_text
 
@@ -60,7 +61,7 @@ class TextRenderer:
         pre = (
             f'<pre class="plotsrv-pre ps-text-pre" '
             f'data-plotsrv-pre="1" '
-            f'data-plotsrv-text-anchor="{anchor}">{_escape_html(out)}</pre>'
+            f'data-plotsrv-text-anchor="{anchor}">{escape_html(out)}</pre>'
         )
         html = f"{toolbar}\n{pre}\n</div>"
 
@@ -93,24 +94,7 @@ def _to_text_and_anchor(obj: Any) -> tuple[str, Literal["head", "tail"]]:
         return _strip_anchor_header(obj)
 
     if isinstance(obj, (bytes, bytearray)):
-        try:
-            s = bytes(obj).decode("utf-8")
-        except Exception:
-            s = bytes(obj).decode("utf-8", errors="replace")
-        return _strip_anchor_header(s)
+        # One decode pass, no bytes() copy; "replace" is a no-op for valid UTF-8.
+        return _strip_anchor_header(obj.decode("utf-8", "replace"))
 
     return repr(obj), "head"
-
-
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
-
-
-def _escape_attr(s: str) -> str:
-    return _escape_html(s).replace("\n", " ").replace("\r", " ")
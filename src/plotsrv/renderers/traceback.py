@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from ._escape import escape_html
 from .base import Renderer, RenderResult
 from .. import config
 
@@ -46,50 +47,18 @@ class TracebackRenderer(Renderer):
 
         header = (
             f'<div class="ps-traceback__header">'
-            f"<strong>{_escape_html(exc_type)}</strong>"
+            f"<strong>{escape_html(exc_type)}</strong>"
         )
         if exc_msg:
-            header += f": {_escape_html(exc_msg)}"
+            header += f": {escape_html(exc_msg)}"
         header += "</div>"
 
-        items: list[str] = []
-        for i, fr in enumerate(frames):
-            if not isinstance(fr, dict):
-                continue
-            filename = str(fr.get("filename") or "<?>")
-            lineno = fr.get("lineno")
-            func = str(fr.get("function") or "<module>")
-            line = str(fr.get("line") or "")
-            ctx_before = fr.get("context_before") or []
-            ctx_after = fr.get("context_after") or []
-
-            where = f"{filename}:{lineno}" if lineno is not None else filename
-
-            ctx_lines: list[str] = []
-            for s in ctx_before:
-                ctx_lines.append(_escape_html(str(s)))
-            if line:
-                ctx_lines.append(f"<mark>{_escape_html(line)}</mark>")
-            for s in ctx_after:
-                ctx_lines.append(_escape_html(str(s)))
-
-            ctx_html = ""
-            if ctx_lines:
-                ctx_html = (
-                    "<pre class='ps-traceback__code'>" + "\n".join(ctx_lines) + "</pre>"
-                )
-
-            items.append(f"""
-<details class="ps-traceback__frame" {"open" if i == 0 else ""}>
-  <summary class="ps-traceback__summary">
-    <span class="ps-traceback__func">{_escape_html(func)}</span>
-    <span class="ps-traceback__where">{_escape_html(where)}</span>
-  </summary>
-  {ctx_html}
-</details>
-""".strip())
-
-        body = '<div class="ps-traceback__frames">' + "\n".join(items) + "</div>"
+        items = "\n".join(
+            _frame_html(fr, is_first=i == 0)
+            for i, fr in enumerate(frames)
+            if isinstance(fr, dict)
+        )
+        body = '<div class="ps-traceback__frames">' + items + "</div>"
 
         html = f"""
 <div class="ps-traceback">
@@ -106,11 +75,40 @@ class TracebackRenderer(Renderer):
         )
 
 
-def _escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
+_FRAME_HTML = """
+<details class="ps-traceback__frame" {open_attr}>
+  <summary class="ps-traceback__summary">
+    <span class="ps-traceback__func">{func}</span>
+    <span class="ps-traceback__where">{where}</span>
+  </summary>
+  {ctx_html}
+</details>
+""".strip()
+
+
+def _frame_html(fr: dict[str, Any], *, is_first: bool) -> str:
+    esc = escape_html
+    filename = str(fr.get("filename") or "<?>")
+    lineno = fr.get("lineno")
+    func = str(fr.get("function") or "<module>")
+    line = str(fr.get("line") or "")
+    ctx_before = fr.get("context_before") or []
+    ctx_after = fr.get("context_after") or []
+
+    where = f"{filename}:{lineno}" if lineno is not None else filename
+
+    ctx_lines = [esc(str(s)) for s in ctx_before]
+    if line:
+        ctx_lines.append(f"<mark>{esc(line)}</mark>")
+    ctx_lines.extend(esc(str(s)) for s in ctx_after)
+
+    ctx_html = ""
+    if ctx_lines:
+        ctx_html = "<pre class='ps-traceback__code'>" + "\n".join(ctx_lines) + "</pre>"
+
+    return _FRAME_HTML.format(
+        open_attr="open" if is_first else "",
+        func=esc(func),
+        where=esc(where),
+        ctx_html=ctx_html,
     )
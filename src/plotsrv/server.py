@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import threading
+import time
 from contextlib import contextmanager
 from typing import Any
 from pathlib import Path
@@ -24,20 +25,13 @@ import uvicorn
 from fastapi import BackgroundTasks, HTTPException
 
 from .app import app, require_local_request
-from .backends import fig_to_png_bytes, df_to_html_simple
+from .backends import fig_to_png_bytes, df_to_html_simple, plotnine_ggplot_type
 from . import store, config
 from .storage.worker import stop_storage_worker, enqueue_snapshot
 from .storage.latest import FileLatestStateBackend
 from .file_kinds import coerce_file_to_publishable
 from .json_model import build_json_document
 
-# plotnine support (optional)
-try:  # pragma: no cover
-    from plotnine.ggplot import ggplot as PlotnineGGPlot  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover
-    PlotnineGGPlot = None  # type: ignore[assignment]
-
-
 # ---- Server state
 
 _SERVER_THREAD: threading.Thread | None = None
@@ -114,6 +108,12 @@ def _wait_for_server_ready(host: str, port: int, *, timeout_s: float = 5.0) -> b
     return False
 
 
+def _server_active_locked() -> bool:
+    """Whether a server is running or starting. Caller holds _SERVER_LOCK."""
+    thread_alive = _SERVER_THREAD is not None and _SERVER_THREAD.is_alive()
+    return _SERVER_RUNNING or _SERVER_STARTING or thread_alive
+
+
 def _ensure_server_running(host: str, port: int, quiet: bool) -> bool:
     """
     Start server in a background thread if not already running or starting.
@@ -126,10 +126,7 @@ def _ensure_server_running(host: str, port: int, quiet: bool) -> bool:
     global _CURRENT_HOST, _CURRENT_PORT
 
     with _SERVER_LOCK:
-        thread_alive = _SERVER_THREAD is not None and _SERVER_THREAD.is_alive()
-        active = _SERVER_RUNNING or _SERVER_STARTING or thread_alive
-
-        if active:
+        if _server_active_locked():
             if host != _CURRENT_HOST or port != _CURRENT_PORT:
                 raise RuntimeError(
                     f"plotsrv server already running on {_CURRENT_HOST}:{_CURRENT_PORT}; "
@@ -189,7 +186,8 @@ def _object_to_figure(obj: Any | None, force_plotnine: bool) -> Figure:
             )
         return obj.draw()  # type: ignore[no-any-return]
 
-    if PlotnineGGPlot is not None and isinstance(obj, PlotnineGGPlot):  # type: ignore[arg-type]
+    ggplot_type = plotnine_ggplot_type()
+    if ggplot_type is not None and isinstance(obj, ggplot_type):
         return obj.draw()  # type: ignore[no-any-return]
 
     if hasattr(obj, "draw") and obj.__class__.__module__.startswith("plotnine"):
@@ -209,7 +207,8 @@ def _looks_like_plot_object(obj: Any | None) -> bool:
     if isinstance(obj, Figure):
         return True
 
-    if PlotnineGGPlot is not None and isinstance(obj, PlotnineGGPlot):  # type: ignore[arg-type]
+    ggplot_type = plotnine_ggplot_type()
+    if ggplot_type is not None and isinstance(obj, ggplot_type):
         return True
 
     if hasattr(obj, "draw") and obj.__class__.__module__.startswith("plotnine"):
@@ -515,6 +514,8 @@ def refresh_view(
     force_plotnine: bool = False,
     update_status: bool = True,
     launch_server: bool = True,
+    update_limit_s: int | None = None,
+    force: bool = False,
 ) -> None:
     """
     Update an in-process plotsrv view directly.
@@ -531,6 +532,11 @@ def refresh_view(
 
     If label/section/view_id are omitted, refreshes the active/default view for
     backwards compatibility.
+
+    update_limit_s applies the same per-view throttle as POST /publish: a
+    refresh arriving within update_limit_s seconds of the last accepted one is
+    dropped before anything is rendered. force=True bypasses the throttle.
+    Every stored refresh counts as a publish for later throttled calls.
     """
     resolved_view_id = _view_id_for_refresh(
         view_id=view_id,
@@ -538,6 +544,13 @@ def refresh_view(
         label=label,
     )
 
+    now_s = time.time()
+    if update_limit_s is not None and not force:
+        if not store.should_accept_publish(
+            view_id=resolved_view_id, update_limit_s=update_limit_s, now_s=now_s
+        ):
+            return
+
     forced_kind = (kind or "").strip().lower() or None
 
     # Path-like file mode
@@ -571,6 +584,7 @@ def refresh_view(
 
             if update_status:
                 store.mark_success(duration_s=None, view_id=resolved_view_id)
+            store.note_publish(resolved_view_id, now_s=now_s)
 
             _enqueue_refresh_persistence(
                 resolved_view_id=resolved_view_id,
@@ -604,6 +618,7 @@ def refresh_view(
 
         if update_status:
             store.mark_success(duration_s=None, view_id=resolved_view_id)
+        store.note_publish(resolved_view_id, now_s=now_s)
 
         _enqueue_refresh_persistence(
             resolved_view_id=resolved_view_id,
@@ -638,6 +653,7 @@ def refresh_view(
 
         if update_status:
             store.mark_success(duration_s=None, view_id=resolved_view_id)
+        store.note_publish(resolved_view_id, now_s=now_s)
 
         _enqueue_refresh_persistence(
             resolved_view_id=resolved_view_id,
@@ -667,6 +683,7 @@ def refresh_view(
 
         if update_status:
             store.mark_success(duration_s=None, view_id=resolved_view_id)
+        store.note_publish(resolved_view_id, now_s=now_s)
 
         _enqueue_refresh_persistence(
             resolved_view_id=resolved_view_id,
@@ -701,6 +718,7 @@ def refresh_view(
 
         if update_status:
             store.mark_success(duration_s=None, view_id=resolved_view_id)
+        store.note_publish(resolved_view_id, now_s=now_s)
 
         _enqueue_refresh_persistence(
             resolved_view_id=resolved_view_id,
@@ -793,7 +811,13 @@ def start_server(
     _DEFAULT_HOST = host
     _DEFAULT_PORT = port
 
-    if restore_latest:
+    # Restoring is a startup step. publish_view() calls start_server() on
+    # every local publish, and re-restoring then would re-read storage and
+    # overwrite live views with their (possibly older) persisted state.
+    with _SERVER_LOCK:
+        already_active = _server_active_locked()
+
+    if restore_latest and not already_active:
         restore_latest_views_from_storage()
 
     started = _ensure_server_running(host, port, quiet=quiet)
@@ -0,0 +1,10 @@
+# tests/_asserts.py
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+def assert_all_in(haystack: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in haystack, reporting all missing ones at once."""
+    missing = [n for n in needles if n not in haystack]
+    assert not missing, f"missing from output: {missing!r}"
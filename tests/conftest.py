@@ -0,0 +1,83 @@
+# tests/conftest.py
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+import matplotlib
+
+# Headless backend for the whole suite, before any test imports pyplot.
+matplotlib.use("Agg")
+
+import pytest  # noqa: E402
+
+from plotsrv.ui_config import UISettings  # noqa: E402
+
+
+@pytest.fixture
+def fake_post(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """
+    Patch plotsrv.publisher._post and capture the last publish.
+
+    Returns the dict that receives "url" and "data".
+    """
+    import plotsrv.publisher as pub
+
+    captured: dict[str, Any] = {}
+
+    def _post(host: str, port: int, data: bytes) -> tuple[int, str, bytes]:
+        captured["url"] = f"http://{host}:{port}/publish"
+        captured["data"] = data
+        return 200, "OK", b"ok"
+
+    monkeypatch.setattr(pub, "_post", _post)
+    return captured
+
+
+@pytest.fixture
+def fake_ggplot(monkeypatch: pytest.MonkeyPatch) -> type:
+    """
+    Register a stand-in plotnine.ggplot module and return its ggplot class.
+
+    draw() returns the class's `figure` sentinel. Subclasses defined in a test
+    module are recognised only through this class, not by module name.
+    """
+
+    class FakeGGPlot:
+        figure: Any = object()
+
+        def draw(self) -> Any:
+            return self.figure
+
+    mod = types.ModuleType("plotnine.ggplot")
+    mod.ggplot = FakeGGPlot  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "plotnine.ggplot", mod)
+    return FakeGGPlot
+
+
+@pytest.fixture(scope="module")
+def ui_default() -> UISettings:
+    """
+    A fully-populated UISettings for HTML rendering tests.
+
+    UISettings is frozen, so tests override fields with dataclasses.replace().
+    """
+    return UISettings(
+        logo_url="/static/x.png",
+        header_text="t",
+        header_fill_colour="#fff",
+        terminate_process_option=True,
+        auto_refresh_option=True,
+        export_image=True,
+        export_table=True,
+        show_history_controls=True,
+        show_history_banner=True,
+        show_freshness=True,
+        show_statusline=True,
+        show_help_note=True,
+        show_view_selector=True,
+        assets_dir=None,
+        page_title="test",
+        favicon_url="/static/x.png",
+    )
@@ -56,11 +56,6 @@ def test_table_export_csv_returns_attachment(client: TestClient) -> None:
     assert "plotsrv_table.csv" in cd
 
 
-def test_artifact_404_when_none(client: TestClient) -> None:
-    r = client.get("/artifact")
-    assert r.status_code == 404
-
-
 def test_publish_artifact_kind_then_artifact_endpoint_renders(
     client: TestClient,
 ) -> None:
@@ -68,6 +68,48 @@ def test_table_data_returns_json_sample(client: TestClient) -> None:
     assert len(data["rows"]) == 2
 
 
+def test_table_data_nulls_missing_values(client: TestClient) -> None:
+    df = pd.DataFrame(
+        {
+            "a": [1.5, float("nan")],
+            "b": ["x", None],
+            "t": pd.to_datetime(["2020-01-01", None]),
+        }
+    )
+    store.set_table(df, html_simple=None)
+
+    resp = client.get("/table/data")
+    assert resp.status_code == 200
+
+    rows = resp.json()["rows"]
+    assert rows[0]["a"] == 1.5
+    assert rows[1] == {"a": None, "b": None, "t": None}
+
+
+def test_table_data_is_gzipped_when_accepted(client: TestClient) -> None:
+    df = pd.DataFrame({"a": range(500), "b": ["some repeated text"] * 500})
+    store.set_table(df, html_simple=None)
+
+    resp = client.get("/table/data", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.json()["returned_rows"] == 500
+
+    plain = client.get("/table/data", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == resp.json()
+
+
+def test_plot_png_is_not_gzipped(client: TestClient) -> None:
+    png = b"\x89PNG" + b"\x00" * 4096
+    store.set_plot(png)
+
+    resp = client.get("/plot", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.content == png
+
+
 def test_index_none_shows_empty_state(client: TestClient) -> None:
     store.reset()
     resp = client.get("/")
@@ -215,6 +257,38 @@ def test_publish_respects_update_limit(client: TestClient) -> None:
     assert data2["view_id"] == "etl-1:import"
 
 
+def test_publish_accepts_batch_and_reports_per_item(client: TestClient) -> None:
+    batch = [
+        {
+            "kind": "table",
+            "label": "import",
+            "section": "etl-1",
+            "table": {"columns": ["a"], "rows": [[1], [2]]},
+        },
+        {"kind": "bogus", "label": "bad"},
+        {"kind": "artifact", "label": "msg", "artifact_kind": "text", "artifact": "hi"},
+    ]
+
+    r = client.post("/publish", json=batch)
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert [res["ok"] for res in results] == [True, False, True]
+    assert results[1]["status_code"] == 422
+
+    r2 = client.get("/table/data?view=etl-1:import&limit=5")
+    assert r2.json()["rows"] == [{"a": 1}, {"a": 2}]
+
+
+def test_publish_rejects_oversized_batch(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "get_publish_max_batch_items", lambda: 1)
+    item = {"kind": "artifact", "label": "msg", "artifact_kind": "text", "artifact": "x"}
+
+    r = client.post("/publish", json=[item, item])
+    assert r.status_code == 413
+
+
 def test_status_includes_restored_fields(client: TestClient) -> None:
     vid = store.register_view(section="demo", label="message", kind="artifact")
     store.set_artifact(
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import sys
+import types
+
 import pandas as pd
+import pytest
 from matplotlib.figure import Figure
 
-from plotsrv.backends import fig_to_png_bytes, df_to_html_simple, df_to_rich_sample
+from plotsrv.backends import (
+    fig_to_png_bytes,
+    df_to_html_simple,
+    df_to_records,
+    df_to_split_sample,
+    plotnine_ggplot_type,
+)
 
 
 def test_fig_to_png_bytes_returns_png_bytes() -> None:
@@ -28,15 +38,30 @@ def test_df_to_html_simple_honours_max_rows() -> None:
     assert ">3<" not in html
 
 
-def test_df_to_rich_sample_structure_and_limits() -> None:
-    df = pd.DataFrame({"x": list(range(10)), "y": list(range(10, 20))})
+def test_plotnine_ggplot_type_requires_plotnine_imported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delitem(sys.modules, "plotnine.ggplot", raising=False)
+    assert plotnine_ggplot_type() is None
 
-    sample = df_to_rich_sample(df, max_rows=4)
+    mod = types.ModuleType("plotnine.ggplot")
+    mod.ggplot = type("ggplot", (), {})  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "plotnine.ggplot", mod)
+    assert plotnine_ggplot_type() is mod.ggplot  # type: ignore[attr-defined]
 
-    assert sample["columns"] == ["x", "y"]
-    assert len(sample["rows"]) == 4
-    assert sample["total_rows"] == 10
-    assert sample["returned_rows"] == 4
 
-    first_row = sample["rows"][0]
-    assert first_row == {"x": 0, "y": 10}
+def test_df_to_records_nulls_missing() -> None:
+    df = pd.DataFrame({"x": [1.0, None], "y": ["a", None]})
+
+    assert df_to_records(df) == [{"x": 1.0, "y": "a"}, {"x": None, "y": None}]
+
+
+def test_df_to_split_sample_uses_list_rows_and_nulls_missing() -> None:
+    df = pd.DataFrame({"x": [1.0, None, 3.0], "y": ["a", "b", None]})
+
+    sample = df_to_split_sample(df, max_rows=2)
+
+    assert sample["columns"] == ["x", "y"]
+    assert sample["rows"] == [[1.0, "a"], [None, "b"]]
+    assert sample["total_rows"] == 3
+    assert sample["returned_rows"] == 2
@@ -255,6 +255,7 @@ def test_plot_render_defaults_without_yaml() -> None:
     assert cfg.get_plot_default_figsize_in() == (12.0, 6.0)
     assert cfg.get_plot_bbox_tight() is True
     assert cfg.get_plot_pad_inches() == 0.10
+    assert cfg.get_plot_png_compress_level() == 3
 
 
 def test_view_order_returns_none_for_non_list_shapes(tmp_path: Path) -> None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import base64
 import builtins
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -90,6 +91,17 @@ def test_coerce_json(tmp_path: Path) -> None:
     assert doc["meta"]["source_filename"] == "x.json"
 
 
+def test_json_loads_falls_back_to_stdlib_for_non_strict_json() -> None:
+    assert fk._json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    out = fk._json_loads('{"nan": NaN, "big": 123456789012345678901234567890}')
+    assert out["nan"] != out["nan"]
+    assert out["big"] == 123456789012345678901234567890
+
+    with pytest.raises(ValueError):
+        fk._json_loads("{not json")
+
+
 def test_coerce_ini(tmp_path: Path) -> None:
     p = tmp_path / "x.ini"
     p.write_text(
@@ -214,6 +226,112 @@ def test_coerce_csv_respects_max_rows(tmp_path: Path) -> None:
     assert len(df) == 1
 
 
+def _read_csv_without_pyarrow(
+    monkeypatch: pytest.MonkeyPatch, raw: bytes, nrows: int | None
+) -> Any:
+    import sys
+
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, "pyarrow", None)
+        return fk._read_csv_frame(raw, encoding="utf-8", nrows=nrows)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"a,b\n1,x\n2,\n3,z\n",
+        b"d,t,ts\n2024-01-01,12:00:00,2024-01-01T10:00:00\n2024-01-02,13:00:00,2024-01-02T11:00:00\n",
+        b"a,a,b\n1,2,3\n",
+        b",a\n1,2\n",
+        b'a,b\n"line 1\nline 2",1\nz,2\n',
+        b"a,b\n1,2\n3,4,5\n6,7\n",
+        b"a,b\n1,2\n3\n",
+    ],
+    ids=[
+        "plain",
+        "dates",
+        "duplicate_headers",
+        "blank_header",
+        "quoted_newline",
+        "long_row",
+        "short_row",
+    ],
+)
+@pytest.mark.parametrize("nrows", [None, 1])
+def test_read_csv_frame_pyarrow_matches_pandas(
+    monkeypatch: pytest.MonkeyPatch, raw: bytes, nrows: int | None
+) -> None:
+    import pandas as pd
+
+    pytest.importorskip("pyarrow.csv")
+
+    fast = fk._read_csv_frame(raw, encoding="utf-8", nrows=nrows)
+    slow = _read_csv_without_pyarrow(monkeypatch, raw, nrows)
+
+    pd.testing.assert_frame_equal(fast, slow)
+
+
+class _CountingReader:
+    """Wraps a pyarrow CSV reader, counting how many batches were read."""
+
+    def __init__(self, reader: Any) -> None:
+        self.reader = reader
+        self.schema = reader.schema
+        self.batches_read = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for batch in self.reader:
+            self.batches_read += 1
+            yield batch
+
+
+def test_coerce_csv_pyarrow_stops_reading_at_max_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pacsv = pytest.importorskip("pyarrow.csv")
+
+    real_read_options = pacsv.ReadOptions
+    real_open_csv = pacsv.open_csv
+    readers: list[_CountingReader] = []
+
+    def small_blocks(**kwargs: Any) -> Any:
+        return real_read_options(block_size=64, **kwargs)
+
+    def counting_open_csv(*args: Any, **kwargs: Any) -> _CountingReader:
+        readers.append(_CountingReader(real_open_csv(*args, **kwargs)))
+        return readers[-1]
+
+    monkeypatch.setattr(pacsv, "ReadOptions", small_blocks)
+    monkeypatch.setattr(pacsv, "open_csv", counting_open_csv)
+
+    p = tmp_path / "x.csv"
+    p.write_text("a,b\n" + "".join(f"{i},{i}\n" for i in range(1000)), encoding="utf-8")
+    out = fk.coerce_file_to_publishable(p, max_rows=3)
+
+    assert list(out.obj["a"]) == [0, 1, 2]
+    assert readers[-1].batches_read == 1
+
+    out = fk.coerce_file_to_publishable(p)
+    assert len(out.obj) == 1000
+    assert readers[-1].batches_read > 1
+
+
+def test_coerce_csv_does_not_hide_other_pyarrow_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pacsv = pytest.importorskip("pyarrow.csv")
+
+    def broken_open_csv(*args: Any, **kwargs: Any) -> Any:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(pacsv, "open_csv", broken_open_csv)
+
+    p = tmp_path / "x.csv"
+    p.write_text("a,b\n1,2\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="boom"):
+        fk.coerce_file_to_publishable(p)
+
+
 def test_coerce_image_payload(tmp_path: Path) -> None:
     p = tmp_path / "x.png"
     raw = b"\x89PNG\r\n\x1a\n" + b"abc123"
@@ -1,30 +1,19 @@
 # tests/test_html.py
 from __future__ import annotations
 
+from dataclasses import replace
+
 from plotsrv.ui_config import UISettings
 from plotsrv.store import ViewMeta
 import plotsrv.html as html_mod
 
+from tests._asserts import assert_all_in
 
-def test_render_index_includes_view_dropdown_and_selected_option_basic() -> None:
-    ui = UISettings(
-        logo_url="/static/x.png",
-        header_text="t",
-        header_fill_colour="#fff",
-        terminate_process_option=True,
-        auto_refresh_option=True,
-        export_image=True,
-        export_table=True,
-        show_history_controls=True,
-        show_history_banner=True,
-        show_freshness=True,
-        show_statusline=True,
-        show_help_note=True,
-        show_view_selector=True,
-        assets_dir=None,
-        page_title="test",
-        favicon_url="/static/x.png",
-    )
+
+def test_render_index_includes_view_dropdown_and_selected_option_basic(
+    ui_default: UISettings,
+) -> None:
+    ui = ui_default
 
     views = [
         ViewMeta(view_id="etl-1:import", kind="none", label="import", section="etl-1"),
@@ -44,39 +33,27 @@ def test_render_index_includes_view_dropdown_and_selected_option_basic() -> None
         active_view_id="etl-1:metrics",
     )
 
-    # New custom selector exists
-    assert 'data-plotsrv-viewselect="1"' in html
-    assert 'class="ps-viewselect__btn"' in html
-    assert 'role="listbox"' in html
-
-    # Both items present
-    assert 'data-plotsrv-view="etl-1:import"' in html
-    assert 'data-plotsrv-view="etl-1:metrics"' in html
-
-    # Selected state present for active view
-    assert (
-        'data-plotsrv-view="etl-1:metrics"' in html and 'aria-selected="true"' in html
+    assert_all_in(
+        html,
+        [
+            # New custom selector exists
+            'data-plotsrv-viewselect="1"',
+            'class="ps-viewselect__btn"',
+            'role="listbox"',
+            # Both items present
+            'data-plotsrv-view="etl-1:import"',
+            'data-plotsrv-view="etl-1:metrics"',
+            # Selected state present for active view
+            'aria-selected="true"',
+        ],
     )
 
 
-def test_render_index_includes_view_dropdown_and_selected_option_with_title_and_favicon() -> (
-    None
-):
-    ui = UISettings(
-        logo_url="/static/x.png",
-        header_text="t",
-        header_fill_colour="#fff",
-        terminate_process_option=True,
-        auto_refresh_option=True,
-        export_image=True,
-        export_table=True,
-        show_history_controls=True,
-        show_history_banner=True,
-        show_freshness=True,
-        show_statusline=True,
-        show_help_note=True,
-        show_view_selector=True,
-        assets_dir=None,
+def test_render_index_includes_view_dropdown_and_selected_option_with_title_and_favicon(
+    ui_default: UISettings,
+) -> None:
+    ui = replace(
+        ui_default,
         page_title="plotsrv - live view",
         favicon_url="/static/plotsrv_favicon.png",
     )
@@ -99,31 +76,26 @@ def test_render_index_includes_view_dropdown_and_selected_option_with_title_and_
         active_view_id="etl-1:metrics",
     )
 
-    # Title + favicon still rendered
-    assert "<title>plotsrv - live view</title>" in html
-    assert 'rel="icon" href="/static/plotsrv_favicon.png"' in html
-
-    # New custom selector exists
-    assert 'data-plotsrv-viewselect="1"' in html
-    assert 'data-plotsrv-view="etl-1:metrics"' in html
+    assert_all_in(
+        html,
+        [
+            # Title + favicon still rendered
+            "<title>plotsrv - live view</title>",
+            'rel="icon" href="/static/plotsrv_favicon.png"',
+            # New custom selector exists
+            'data-plotsrv-viewselect="1"',
+            'data-plotsrv-view="etl-1:metrics"',
+        ],
+    )
 
 
-def test_render_index_escapes_view_labels_and_header_text() -> None:
-    ui = UISettings(
+def test_render_index_escapes_view_labels_and_header_text(
+    ui_default: UISettings,
+) -> None:
+    ui = replace(
+        ui_default,
         logo_url="javascript:alert(1)",
         header_text="<script>alert(1)</script>",
-        header_fill_colour="#fff",
-        terminate_process_option=True,
-        auto_refresh_option=True,
-        export_image=True,
-        export_table=True,
-        show_history_controls=True,
-        show_history_banner=True,
-        show_freshness=True,
-        show_statusline=True,
-        show_help_note=True,
-        show_view_selector=True,
-        assets_dir=None,
         page_title="<b>bad</b>",
         favicon_url="javascript:alert(1)",
     )
@@ -149,33 +121,23 @@ def test_render_index_escapes_view_labels_and_header_text() -> None:
     )
 
     assert "<script>alert(1)</script>" not in html
-    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
-    assert "&lt;b&gt;bad&lt;/b&gt;" in html
     assert "javascript:alert(1)" not in html
     assert 'onclick="alert(1)' not in html
-    assert "&quot; onclick=&quot;alert(1)" in html
-
-
-def test_render_index_empty_state_mentions_publish_view_and_refresh_view() -> None:
-    ui = UISettings(
-        logo_url="/static/x.png",
-        header_text="",
-        header_fill_colour="#fff",
-        terminate_process_option=False,
-        auto_refresh_option=True,
-        export_image=True,
-        export_table=True,
-        show_history_controls=True,
-        show_history_banner=True,
-        show_freshness=True,
-        show_statusline=True,
-        show_help_note=True,
-        show_view_selector=True,
-        assets_dir=None,
-        page_title="test",
-        favicon_url="/static/x.png",
+    assert_all_in(
+        html,
+        [
+            "&lt;script&gt;alert(1)&lt;/script&gt;",
+            "&lt;b&gt;bad&lt;/b&gt;",
+            "&quot; onclick=&quot;alert(1)",
+        ],
     )
 
+
+def test_render_index_empty_state_mentions_publish_view_and_refresh_view(
+    ui_default: UISettings,
+) -> None:
+    ui = replace(ui_default, header_text="", terminate_process_option=False)
+
     html = html_mod.render_index(
         kind="none",
         table_view_mode="simple",
@@ -187,6 +149,28 @@ def test_render_index_empty_state_mentions_publish_view_and_refresh_view() -> No
         active_view_id="default",
     )
 
-    assert "Waiting for views" in html
-    assert "plotsrv is running" in html
-    assert "from Python" in html
+    assert_all_in(html, ["Waiting for views", "plotsrv is running", "from Python"])
+
+
+def test_render_index_reflects_view_freshness(ui_default: UISettings) -> None:
+    views = [
+        ViewMeta(view_id="etl-1:import", kind="none", label="import", section="etl-1"),
+    ]
+    kwargs = dict(
+        kind="plot",
+        table_view_mode="simple",
+        table_html_simple=None,
+        max_table_rows_simple=200,
+        max_table_rows_rich=1000,
+        ui_settings=ui_default,
+        views=views,
+        active_view_id="etl-1:import",
+    )
+
+    fresh = html_mod.render_index(**kwargs)
+    stale = html_mod.render_index(
+        **kwargs,
+        view_freshness={"etl-1:import": {"state": "warn", "label": "Stale"}},
+    )
+    assert stale != fresh
+    assert "ps-viewselect__item--warn" in stale
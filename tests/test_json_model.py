@@ -168,6 +168,60 @@ def test_build_pretty_text_with_unserializable_object() -> None:
     assert "<X>" in text
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_build_pretty_text_matches_stdlib_indent(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson and jm.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(jm, "orjson", None)
+
+    obj = {"a": [1, 2.5, True, None], "b": {}, "c": [], "d": "caf\u00e9\tx"}
+    expected = '{\n  "a": [\n    1,\n    2.5,\n    true,\n    null\n  ],\n'
+    expected += '  "b": {},\n  "c": [],\n  "d": "caf\u00e9\\tx"\n}'
+    assert build_pretty_text(obj) == expected
+
+
+def test_build_pretty_text_falls_back_for_wide_ints() -> None:
+    text = build_pretty_text({"big": 2**70})
+    assert str(2**70) in text
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"tiny": 1e-7, "neg": -2.5e-9, "big": 1e16},
+        {"big": 2**70},
+    ],
+    ids=["small_floats", "wide_int"],
+)
+def test_build_pretty_text_same_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, obj: Any
+) -> None:
+    if jm.orjson is None:
+        pytest.skip("orjson not installed")
+
+    fast = build_pretty_text(obj)
+    monkeypatch.setattr(jm, "orjson", None)
+    assert build_pretty_text(obj) == fast
+
+
+def test_build_pretty_text_dataframe_sample_nan_is_null(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"a": [1.5, float("nan")], "b": [1e-7, 2.0]})
+
+    fast = build_pretty_text(df)
+    monkeypatch.setattr(jm, "orjson", None)
+    slow = build_pretty_text(df)
+
+    assert fast == slow
+    assert "NaN" not in slow
+    assert '"a": null' in slow
+
+
 @dataclass
 class DuckLimits:
     max_depth: int = 1
@@ -278,3 +332,48 @@ def test_summarise_container_fallback_type_name() -> None:
         pass
 
     assert jm._summarise_container(Weird()) == "Weird"
+
+
+def test_build_json_document_stops_walking_once_node_cap_is_hit() -> None:
+    doc = build_json_document(
+        {"xs": list(range(100)), "ys": list(range(100))},
+        source_format="python_object",
+        limits=JsonModelLimits(max_nodes=5),
+    )
+
+    xs = _child(doc["root"], "xs")
+    assert doc["meta"]["hit"] == "max_nodes"
+    assert doc["meta"]["node_count"] == 6
+    assert len(xs["children"]) == 4
+    assert xs["children"][-1]["truncation_reason"] == "node limit"
+    assert [c["display_key"] for c in doc["root"]["children"]] == ["xs"]
+
+
+def test_build_json_document_counts_hidden_items_within_node_budget() -> None:
+    small = build_json_document(
+        {"xs": [[1, 2]] * 50},
+        source_format="python_object",
+        limits=JsonModelLimits(max_list_items=3, max_nodes=200),
+    )
+    xs = _child(small["root"], "xs")
+    assert xs["descendant_count"] == 150
+    assert xs["descendant_layer_count"] == 2
+    assert xs["descendant_count_capped"] is False
+
+    big = build_json_document(
+        {"xs": [[1, 2]] * 1000},
+        source_format="python_object",
+        limits=JsonModelLimits(max_list_items=3, max_nodes=100),
+    )
+    xs = _child(big["root"], "xs")
+    assert xs["descendant_count_capped"] is True
+    assert 9 < xs["descendant_count"] < 3000
+    assert big["root"]["descendant_count_capped"] is True
+
+
+def test_looks_like_plot_accepts_loaded_plotnine_subclass(fake_ggplot: type) -> None:
+    class UserPlot(fake_ggplot):  # type: ignore[misc, valid-type]
+        pass
+
+    assert jm._looks_like_plot(UserPlot()) is True
+    assert jm._looks_like_plot({"x": 1}) is False
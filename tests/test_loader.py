@@ -33,6 +33,16 @@ def test_load_callable_from_dynamic_module() -> None:
     assert fn() == "hi"
 
 
+def test_load_callable_sees_rebound_attribute(monkeypatch: pytest.MonkeyPatch) -> None:
+    mod = types.ModuleType("plotsrv_test_mod3")
+    mod.f = lambda: 1  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "plotsrv_test_mod3", mod)
+
+    assert load_callable("plotsrv_test_mod3:f")() == 1
+    mod.f = lambda: 2  # type: ignore[attr-defined]
+    assert load_callable("plotsrv_test_mod3:f")() == 2
+
+
 def test_load_callable_raises_if_not_callable() -> None:
     mod = types.ModuleType("plotsrv_test_mod2")
     mod.x = 123  # type: ignore[attr-defined]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import http.client
+import json
 import time
+from collections.abc import Iterator
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import pytest
-import requests
-import seaborn as sns
 
 from plotsrv import (
     start_server,
@@ -15,17 +16,68 @@ from plotsrv import (
     set_table_view_mode,
 )
 
+HOST = "127.0.0.1"
+PORT = 8765
 
-def _wait_for_status_ok(url: str, timeout: float = 10.0) -> None:
+
+@pytest.fixture(scope="session")
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "age": [10, 20, 30, 40, 50],
+            "fare": [5.0, 10.5, 3.2, 7.7, 12.0],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def conn() -> Iterator[http.client.HTTPConnection]:
+    """
+    One keep-alive loopback connection for all integration requests.
     """
-    Poll the given URL until it responds (200/404) or we hit timeout.
+    c = http.client.HTTPConnection(HOST, PORT, timeout=3.0)
+    yield c
+    c.close()
+
+
+def _get(
+    conn: http.client.HTTPConnection, path: str
+) -> tuple[int, http.client.HTTPMessage, bytes]:
+    try:
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        return resp.status, resp.headers, resp.read()
+    except Exception:
+        # Drop the socket so the next request reconnects.
+        conn.close()
+        raise
+
+
+@pytest.fixture(scope="module")
+def scatter_fig(df: pd.DataFrame) -> Iterator[plt.Figure]:
+    """
+    Seaborn scatterplot drawn once per module; tests re-publish the same Figure.
+    """
+    sns = pytest.importorskip("seaborn")
+    fig, ax = plt.subplots()
+    sns.scatterplot(data=df, x="age", y="fare", ax=ax)
+    ax.set_title("CI test scatterplot")
+    yield fig
+    plt.close(fig)
+
+
+def _wait_for_status_ok(
+    conn: http.client.HTTPConnection, path: str = "/", timeout: float = 10.0
+) -> None:
+    """
+    Poll the given path until it responds (200/404) or we hit timeout.
     This avoids race conditions on uvicorn startup in CI.
     """
     start = time.time()
     while True:
         try:
-            resp = requests.get(url, timeout=0.5)
-            if resp.status_code in (200, 404):
+            status, _, _ = _get(conn, path)
+            if status in (200, 404):
                 return
         except Exception:
             pass
@@ -36,55 +88,42 @@ def _wait_for_status_ok(url: str, timeout: float = 10.0) -> None:
 
 
 @pytest.mark.integration
-def test_plots_and_tables_served_end_to_end() -> None:
-    port = 8765
-    base_url = f"http://127.0.0.1:{port}"
-    plot_url = f"{base_url}/plot"
-    index_url = f"{base_url}/"
-    table_url = f"{base_url}/table/data"
-
+def test_plots_and_tables_served_end_to_end(
+    conn: http.client.HTTPConnection, df: pd.DataFrame, scatter_fig: plt.Figure
+) -> None:
     plotnine = pytest.importorskip("plotnine")
     ggplot = plotnine.ggplot
     aes = plotnine.aes
     geom_point = plotnine.geom_point
 
-    df = pd.DataFrame(
-        {
-            "age": [10, 20, 30, 40, 50],
-            "fare": [5.0, 10.5, 3.2, 7.7, 12.0],
-        }
-    )
-
     try:
         # Start server once
-        start_server(host="127.0.0.1", port=port, auto_on_show=False, quiet=True)
-        _wait_for_status_ok(index_url)
+        start_server(host=HOST, port=PORT, auto_on_show=False, quiet=True)
+        _wait_for_status_ok(conn, "/")
 
         # --- PART 1: matplotlib / seaborn plot ---
-        sns.scatterplot(data=df, x="age", y="fare")
-        plt.title("CI test scatterplot")
-
-        refresh_view()  # use current figure
+        refresh_view(scatter_fig)
 
-        resp = requests.get(plot_url, timeout=3.0)
-        assert resp.status_code == 200
-        assert resp.headers["content-type"].startswith("image/")
-        assert len(resp.content) > 100
+        status, headers, body = _get(conn, "/plot")
+        assert status == 200
+        assert headers["content-type"].startswith("image/")
+        assert len(body) > 100
 
         # --- PART 2: plotnine plot ---
         p = ggplot(df, aes("age", "fare")) + geom_point()
         refresh_view(p)
 
-        resp2 = requests.get(plot_url, timeout=3.0)
-        assert resp2.status_code == 200
-        assert resp2.headers["content-type"].startswith("image/")
-        assert len(resp2.content) > 100
+        status2, headers2, body2 = _get(conn, "/plot")
+        assert status2 == 200
+        assert headers2["content-type"].startswith("image/")
+        assert len(body2) > 100
+        plt.close("all")
 
         # --- PART 3: simple table mode ---
         set_table_view_mode("simple")
         refresh_view(df)
 
-        html = requests.get(index_url, timeout=3.0).text
+        html = _get(conn, "/")[2].decode("utf-8")
         assert "<table" in html
         assert "age" in html and "fare" in html
 
@@ -92,10 +131,10 @@ def test_plots_and_tables_served_end_to_end() -> None:
         set_table_view_mode("rich")
         refresh_view(df)
 
-        html_rich = requests.get(index_url, timeout=3.0).text
+        html_rich = _get(conn, "/")[2].decode("utf-8")
         assert 'id="table-grid"' in html_rich
 
-        json_rich = requests.get(table_url, timeout=3.0).json()
+        json_rich = json.loads(_get(conn, "/table/data")[2])
         assert json_rich["columns"] == ["age", "fare"]
         assert json_rich["total_rows"] == len(df)
 
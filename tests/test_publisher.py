@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import dataclasses
+import enum
+import http.client
 import json
-import urllib.request
+import socket
+from collections.abc import Iterator
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -11,27 +15,8 @@ import pytest
 from plotsrv.publisher import publish_view
 
 
-class DummyResp:
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        return False
-
-    def read(self):
-        return b"ok"
-
-
-def test_publish_view_table_sends_json(monkeypatch) -> None:
-    captured = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["url"] = req.full_url
-        captured["data"] = req.data
-        captured["headers"] = dict(req.headers)
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+def test_publish_view_table_sends_json(fake_post: dict[str, Any]) -> None:
+    captured = fake_post
 
     df = pd.DataFrame({"a": [1, 2]})
     publish_view(df, host="127.0.0.1", port=8000, label="import", section="etl-1")
@@ -45,14 +30,8 @@ def test_publish_view_table_sends_json(monkeypatch) -> None:
     assert payload["table"]["columns"] == ["a"]
 
 
-def test_publish_view_plot_sends_b64_png(monkeypatch) -> None:
-    captured = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+def test_publish_view_plot_sends_b64_png(fake_post: dict[str, Any]) -> None:
+    captured = fake_post
 
     fig = plt.figure()
     publish_view(fig, label="metrics", host="127.0.0.1", port=8000)
@@ -63,14 +42,8 @@ def test_publish_view_plot_sends_b64_png(monkeypatch) -> None:
     assert "plot_png_b64" in payload
 
 
-def test_publish_view_dict_sends_json_artifact(monkeypatch) -> None:
-    captured = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+def test_publish_view_dict_sends_json_artifact(fake_post: dict[str, Any]) -> None:
+    captured = fake_post
 
     publish_view(
         {"status": "ok"},
@@ -91,14 +64,8 @@ def test_publish_view_dict_sends_json_artifact(monkeypatch) -> None:
     assert doc["source_format"] == "python_object"
 
 
-def test_publish_view_string_sends_text_artifact(monkeypatch) -> None:
-    captured = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+def test_publish_view_string_sends_text_artifact(fake_post: dict[str, Any]) -> None:
+    captured = fake_post
 
     publish_view("hello", label="Message", host="127.0.0.1", port=8000)
 
@@ -110,16 +77,10 @@ def test_publish_view_string_sends_text_artifact(monkeypatch) -> None:
 
 
 def test_publish_view_pathlike_file_publishes_file_content(
-    monkeypatch,
     tmp_path,
+    fake_post: dict[str, Any],
 ) -> None:
-    captured = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     p = tmp_path / "app.log"
     p.write_text("line one\nline two\n", encoding="utf-8")
@@ -133,10 +94,12 @@ def test_publish_view_pathlike_file_publishes_file_content(
 
 
 def test_publish_view_swallows_errors(monkeypatch) -> None:
-    def fake_urlopen(*args, **kwargs):
-        raise RuntimeError("no server")
+    from plotsrv import publisher
+
+    def fake_post(*args, **kwargs):
+        raise ConnectionRefusedError("no server")
 
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(publisher, "_post", fake_post)
 
     # should not raise
     publish_view(pd.DataFrame({"a": [1]}), label="x", host="127.0.0.1", port=8000)
@@ -176,6 +139,8 @@ def test_publish_view_without_host_port_uses_local_refresh(
         "view_id": None,
         "kind": None,
         "artifact_kind": None,
+        "update_limit_s": None,
+        "force": False,
     }
 
 
@@ -212,17 +177,8 @@ def test_publish_view_without_label_allowed_in_local_mode(
     assert captured["kwargs"]["view_id"] is None
 
 
-def test_publish_view_with_host_uses_remote_http(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["url"] = req.full_url
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+def test_publish_view_with_host_uses_remote_http(fake_post: dict[str, Any]) -> None:
+    captured = fake_post
 
     publish_view(
         pd.DataFrame({"a": [1]}),
@@ -237,16 +193,9 @@ def test_publish_view_with_host_uses_remote_http(
 
 
 def test_publish_view_with_port_uses_remote_http_default_host(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_post: dict[str, Any],
 ) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["url"] = req.full_url
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     publish_view(
         pd.DataFrame({"a": [1]}),
@@ -297,16 +246,9 @@ def test_publish_view_mode_local_uses_host_port_as_server_bind(
 
 
 def test_publish_view_mode_remote_without_host_port_uses_default_remote(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_post: dict[str, Any],
 ) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["url"] = req.full_url
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     publish_view(
         pd.DataFrame({"a": [1]}),
@@ -358,3 +300,281 @@ def test_publish_view_launch_server_conflicting_port_raises(
             port=8999,
             label="Data",
         )
+
+
+def test_dumps_payload_matches_stdlib_with_and_without_orjson(monkeypatch) -> None:
+    from datetime import date, datetime
+
+    from plotsrv import publisher
+
+    payload = {
+        "kind": "table",
+        "rows": [[1, "a", None, float("nan"), float("inf")]],
+        "when": datetime(2020, 1, 2, 3, 4, 5),
+        "day": date(2020, 1, 2),
+        "tags": {"x"},
+        "pd_na": pd.NA,
+        "ts": pd.Timestamp("2020-01-02 03:04:05"),
+        "big": 2**70,
+    }
+
+    fast = publisher._dumps_payload(payload)
+    monkeypatch.setattr(publisher, "orjson", None)
+    slow = publisher._dumps_payload(payload)
+
+    assert isinstance(fast, bytes)
+    assert json.loads(fast) == json.loads(slow)
+    assert json.loads(slow) == {
+        "kind": "table",
+        "rows": [[1, "a", None, None, None]],
+        "when": "2020-01-02T03:04:05",
+        "day": "2020-01-02",
+        "tags": ["x"],
+        "pd_na": None,
+        "ts": "2020-01-02T03:04:05",
+        "big": 2**70,
+    }
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+
+
+class _Colour(enum.Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [_Point(1), _Colour.RED, {None: 1, 2: "b"}, [{"p": _Point(2)}, _Colour.RED]],
+    ids=["dataclass", "enum", "non_str_keys", "nested"],
+)
+def test_dumps_payload_same_output_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, value: Any
+) -> None:
+    from plotsrv import publisher
+
+    if publisher.orjson is None:
+        pytest.skip("orjson not installed")
+
+    fast = publisher._dumps_payload({"v": value})
+    monkeypatch.setattr(publisher, "orjson", None)
+    slow = publisher._dumps_payload({"v": value})
+
+    assert json.loads(fast) == json.loads(slow)
+
+
+def test_dumps_payload_stringifies_dataclass_and_keys_and_unwraps_enum() -> None:
+    from plotsrv import publisher
+
+    out = publisher._dumps_payload({"d": _Point(1), "e": _Colour.RED, "k": {None: 1}})
+
+    assert json.loads(out) == {
+        "d": "_Point(x=1)",
+        "e": "red",
+        "k": {"None": 1},
+    }
+
+
+def test_dumps_payload_orjson_path_skips_python_walk(monkeypatch) -> None:
+    from plotsrv import publisher
+
+    if publisher.orjson is None:
+        pytest.skip("orjson not installed")
+
+    np = pytest.importorskip("numpy")
+    calls: list[Any] = []
+    real = publisher._json_safe
+
+    def spy(x: Any) -> Any:
+        calls.append(x)
+        return real(x)
+
+    monkeypatch.setattr(publisher, "_json_safe", spy)
+
+    out = publisher._dumps_payload(
+        {"a": [1.5, float("nan")], "arr": np.arange(3), "s": {1}}
+    )
+
+    assert json.loads(out) == {"a": [1.5, None], "arr": [0, 1, 2], "s": [1]}
+    # Only the set (and its members) went through the Python fallback.
+    assert calls[0] == {1}
+    assert not any(isinstance(c, dict) for c in calls)
+
+
+@pytest.fixture
+def publish_server() -> Iterator[tuple[int, list[dict[str, Any]], set[Any]]]:
+    """
+    Minimal keep-alive HTTP server recording publish bodies and client sockets.
+    """
+    import http.server
+    import threading
+
+    bodies: list[dict[str, Any]] = []
+    peers: set[Any] = set()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            n = int(self.headers["Content-Length"])
+            bodies.append(json.loads(self.rfile.read(n)))
+            peers.add(self.client_address)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield srv.server_address[1], bodies, peers
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def test_publish_view_sync_reuses_one_connection(
+    publish_server: tuple[int, list[dict[str, Any]], set[Any]],
+) -> None:
+    from plotsrv import publisher
+
+    port, bodies, peers = publish_server
+    for i in range(3):
+        publish_view(f"msg {i}", host="127.0.0.1", port=port)
+
+    assert [b["artifact"] for b in bodies] == ["msg 0", "msg 1", "msg 2"]
+    assert len(peers) == 1
+
+    # A keep-alive socket dropped by the server is transparently replaced.
+    sock = publisher._get_conn("127.0.0.1", port).sock
+    assert sock is not None
+    sock.shutdown(socket.SHUT_RDWR)
+    publish_view("after drop", host="127.0.0.1", port=port)
+    assert bodies[-1]["artifact"] == "after drop"
+
+
+class _FailingConn:
+    """Keep-alive connection stand-in whose response always fails."""
+
+    def __init__(self, error: Exception) -> None:
+        self.sock: object | None = object()
+        self.error = error
+        self.requests = 0
+
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        self.requests += 1
+
+    def getresponse(self) -> Any:
+        raise self.error
+
+    def close(self) -> None:
+        self.sock = None
+
+
+@pytest.mark.parametrize(
+    ("error", "attempts"),
+    [
+        (TimeoutError("timed out"), 1),
+        (http.client.RemoteDisconnected("closed"), 2),
+        (ConnectionResetError("reset"), 2),
+    ],
+)
+def test_post_resends_only_after_a_dropped_keep_alive_socket(
+    monkeypatch: pytest.MonkeyPatch, error: Exception, attempts: int
+) -> None:
+    from plotsrv import publisher
+
+    conn = _FailingConn(error)
+    monkeypatch.setattr(publisher, "_get_conn", lambda host, port: conn)
+
+    with pytest.raises(type(error)):
+        publisher._post("127.0.0.1", 8000, b"{}")
+
+    assert conn.requests == attempts
+
+
+def test_publish_view_background_reuses_one_connection(
+    publish_server: tuple[int, list[dict[str, Any]], set[Any]],
+) -> None:
+    from plotsrv import publisher
+
+    port, bodies, peers = publish_server
+    for i in range(3):
+        publish_view(f"msg {i}", host="127.0.0.1", port=port, background=True)
+
+    assert publisher.flush_publishes(timeout=5.0)
+    assert [b["artifact"] for b in bodies] == ["msg 0", "msg 1", "msg 2"]
+    assert len(peers) == 1
+
+
+def test_publish_batch_coalesces_into_one_post(
+    publish_server: tuple[int, list[Any], set[Any]],
+) -> None:
+    from plotsrv import publisher
+
+    port, bodies, _ = publish_server
+    with publisher.publish_batch():
+        publish_view(pd.DataFrame({"a": [1]}), label="t", host="127.0.0.1", port=port)
+        with publisher.publish_batch():  # nested blocks join the outer batch
+            publish_view("hello", label="m", host="127.0.0.1", port=port)
+        assert bodies == []
+
+    assert len(bodies) == 1
+    assert [p["label"] for p in bodies[0]] == ["t", "m"]
+    assert [p["kind"] for p in bodies[0]] == ["table", "artifact"]
+
+    # Outside the block publishes go out immediately again, as single objects.
+    publish_view("solo", label="s", host="127.0.0.1", port=port)
+    assert bodies[-1]["label"] == "s"
+
+
+def test_publish_batch_sends_nothing_when_block_raises(
+    publish_server: tuple[int, list[Any], set[Any]],
+) -> None:
+    from plotsrv import publisher
+
+    port, bodies, _ = publish_server
+    with pytest.raises(ValueError):
+        with publisher.publish_batch():
+            publish_view("hello", label="m", host="127.0.0.1", port=port)
+            raise ValueError("boom")
+
+    assert bodies == []
+    assert getattr(publisher._LOCAL, "batch", None) is None
+
+
+def test_publish_batch_debug_raises_on_rejected_item(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from plotsrv import publisher
+
+    reply = {
+        "ok": True,
+        "results": [
+            {"ok": True},
+            {"ok": False, "status_code": 413, "detail": "too large"},
+        ],
+    }
+    monkeypatch.setenv("PLOTSRV_DEBUG", "1")
+    monkeypatch.setattr(
+        publisher,
+        "_post",
+        lambda host, port, data: (200, "OK", json.dumps(reply).encode("utf-8")),
+    )
+
+    with pytest.raises(RuntimeError, match="item 1: 413 too large"):
+        with publisher.publish_batch():
+            publish_view("a", label="a", host="127.0.0.1", port=8000)
+            publish_view("b", label="b", host="127.0.0.1", port=8000)
+
+    # Without debug the rejection is dropped, like a failed single publish.
+    monkeypatch.setenv("PLOTSRV_DEBUG", "0")
+    with publisher.publish_batch():
+        publish_view("a", label="a", host="127.0.0.1", port=8000)
+        publish_view("b", label="b", host="127.0.0.1", port=8000)
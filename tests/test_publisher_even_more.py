@@ -3,8 +3,6 @@ from __future__ import annotations
 
 import json
 import os
-import urllib.error
-import urllib.request
 from pathlib import Path
 from typing import Any
 
@@ -14,39 +12,15 @@ import pytest
 import plotsrv.publisher as pub
 
 
-class DummyResp:
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args: Any) -> bool:
-        return False
-
-    def read(self) -> bytes:
-        return b"ok"
-
-
 def test_publish_view_http_error_swallowed_when_not_debug(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.delenv("PLOTSRV_DEBUG", raising=False)
 
-    class _FakeHTTPError(urllib.error.HTTPError):
-        def __init__(self):
-            super().__init__(
-                url="http://127.0.0.1:8000/publish",
-                code=500,
-                msg="Server Error",
-                hdrs=None,
-                fp=None,
-            )
-
-        def read(self) -> bytes:
-            return b"nope"
+    def fake_post(host: str, port: int, data: bytes) -> tuple[int, str, bytes]:
+        return 500, "Server Error", b"nope"
 
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        raise _FakeHTTPError()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(pub, "_post", fake_post)
 
     # should not raise
     pub.publish_view(
@@ -67,7 +41,9 @@ def test_publish_view_forced_plot_with_non_plot_obj_swallowed_when_not_debug(
 
 
 def test_publish_view_pathlike_parse_error_publishes_text_error(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_post: dict[str, Any],
 ) -> None:
     monkeypatch.delenv("PLOTSRV_DEBUG", raising=False)
 
@@ -75,13 +51,7 @@ def test_publish_view_pathlike_parse_error_publishes_text_error(
     p = tmp_path / "bad.json"
     p.write_text("{not json", encoding="utf-8")
 
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     pub.publish_view(p, label="L", section="S", host="127.0.0.1", port=8000)
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import os
-import urllib.request
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -13,17 +12,6 @@ import pytest
 import plotsrv.publisher as pub
 
 
-class DummyResp:
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args: Any) -> bool:
-        return False
-
-    def read(self) -> bytes:
-        return b"ok"
-
-
 def test_to_dataframe_with_pandas() -> None:
     df = pd.DataFrame({"a": [1]})
     out = pub._to_dataframe(df)
@@ -65,6 +53,14 @@ def test_looks_like_plot_variants() -> None:
     plt.close(fig)
 
 
+def test_plotnine_subclass_is_a_plot_once_imported(fake_ggplot: type) -> None:
+    class UserPlot(fake_ggplot):  # type: ignore[misc, valid-type]
+        pass
+
+    assert pub._looks_like_plot(UserPlot()) is True
+    assert pub._to_figure(UserPlot()) is fake_ggplot.figure
+
+
 def test_json_safe_primitives_and_fallback_repr() -> None:
     class X:
         def __str__(self) -> str:
@@ -97,6 +93,43 @@ def test_to_publish_payload_table_contains_table_and_html() -> None:
     assert "table_html_simple" in payload
 
 
+def test_to_publish_payload_table_converts_only_head_of_polars_frame(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    full = pd.DataFrame({"a": range(50)})
+    converted: list[int] = []
+
+    class FakePolarsFrame:
+        def __init__(self, df: pd.DataFrame) -> None:
+            self._df = df
+            self.height = len(df)
+
+        def head(self, n: int) -> FakePolarsFrame:
+            return FakePolarsFrame(self._df.head(n))
+
+        def to_pandas(self) -> pd.DataFrame:
+            converted.append(len(self._df))
+            return self._df
+
+    monkeypatch.setattr(pub, "pl", type("pl", (), {"DataFrame": FakePolarsFrame}))
+    monkeypatch.setattr(pub.config, "get_max_table_rows_rich", lambda: 10)
+    monkeypatch.setattr(pub.config, "get_max_table_rows_simple", lambda: 5)
+
+    payload = pub._to_publish_payload(
+        FakePolarsFrame(full),
+        kind="table",
+        label="L",
+        section="S",
+        update_limit_s=None,
+        force=False,
+    )
+
+    assert converted == [10]
+    assert payload["table"]["total_rows"] == 50
+    assert payload["table"]["returned_rows"] == 10
+    assert payload["table_html_simple"].count("<td>") == 5
+
+
 def test_to_publish_payload_artifact_html_dict() -> None:
     payload = pub._to_publish_payload(
         {"html": "<div>x</div>", "unsafe": True},
@@ -162,15 +195,9 @@ def test_to_publish_payload_artifact_python_repr() -> None:
 
 
 def test_publish_view_html_string_becomes_html_dict(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_post: dict[str, Any],
 ) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     pub.publish_view(
         "<div>x</div>", label="L", artifact_kind="html", host="127.0.0.1", port=8000
@@ -181,15 +208,9 @@ def test_publish_view_html_string_becomes_html_dict(
 
 
 def test_publish_view_forced_artifact_kind_overrides_inferred(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_post: dict[str, Any],
 ) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     pub.publish_view(
         {"a": 1}, label="L", artifact_kind="python", host="127.0.0.1", port=8000
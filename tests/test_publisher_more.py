@@ -4,8 +4,6 @@ from __future__ import annotations
 import json
 import math
 import os
-import urllib.error
-import urllib.request
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -15,17 +13,6 @@ import pytest
 import plotsrv.publisher as pub
 
 
-class DummyResp:
-    def __enter__(self):  # noqa: D401
-        return self
-
-    def __exit__(self, *args: Any) -> bool:  # noqa: D401
-        return False
-
-    def read(self) -> bytes:
-        return b"ok"
-
-
 def test_is_na_scalar_vs_container() -> None:
     assert pub._is_na(float("nan")) is True
     assert pub._is_na(None) is True  # pandas treats None as NA
@@ -34,6 +21,24 @@ def test_is_na_scalar_vs_container() -> None:
     assert pub._is_na({"a": 1}) is False
 
 
+def test_is_na_plain_values_skip_pandas(monkeypatch: pytest.MonkeyPatch) -> None:
+    import pandas as pd
+
+    def boom(x: Any) -> bool:
+        raise AssertionError("pd.isna should not be called")
+
+    assert pub._is_na(pd.NA) is True
+    assert pub._is_na(pd.NaT) is True
+
+    monkeypatch.setattr(pub.pd, "isna", boom)
+    assert pub._is_na(None) is True
+    assert pub._is_na(float("nan")) is True
+    assert pub._is_na(1.5) is False
+    assert pub._is_na("nan") is False
+    assert pub._is_na(True) is False
+    assert pub._is_na(0) is False
+
+
 def test_json_safe_handles_nested_dates_and_nans() -> None:
     x = {
         "a": float("nan"),
@@ -67,6 +72,16 @@ def test_try_array_payload_numpy_if_available() -> None:
     assert payload["data"] == arr.tolist()
 
 
+def test_try_array_payload_samples_non_contiguous_array() -> None:
+    np = pytest.importorskip("numpy")
+    arr = np.arange(6000).reshape(60, 100).T  # transposed -> not C-contiguous
+    payload = pub._try_array_payload(arr)
+    assert payload is not None
+    assert payload["truncated"] is True
+    assert payload["data"] == arr.ravel()[:2000].tolist()
+    assert pub._infer_artifact_kind(arr) == "json"
+
+
 def test_infer_artifact_kind_prefers_json_for_dict() -> None:
     assert pub._infer_artifact_kind({"a": 1}) == "json"
     assert pub._infer_artifact_kind("hello") == "text"
@@ -74,19 +89,13 @@ def test_infer_artifact_kind_prefers_json_for_dict() -> None:
 
 
 def test_publish_view_pathlike_json_file_posts_json(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    tmp_path: Path,
+    fake_post: dict[str, Any],
 ) -> None:
     p = tmp_path / "x.json"
     p.write_text('{"a": 1}', encoding="utf-8")
 
-    captured: dict[str, Any] = {}
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        captured["url"] = req.full_url
-        captured["data"] = req.data
-        return DummyResp()
-
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    captured = fake_post
 
     pub.publish_view(p, label="L", section="S", host="127.0.0.1", port=8000)
 
@@ -108,23 +117,10 @@ def test_publish_view_http_error_raises_in_debug_for_artifact(
 ) -> None:
     monkeypatch.setenv("PLOTSRV_DEBUG", "1")
 
-    class _FakeHTTPError(urllib.error.HTTPError):
-        def __init__(self):
-            super().__init__(
-                url="http://127.0.0.1:8000/publish",
-                code=400,
-                msg="Bad Request",
-                hdrs=None,
-                fp=None,
-            )
-
-        def read(self) -> bytes:
-            return b"bad payload"
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        raise _FakeHTTPError()
+    def fake_post(host: str, port: int, data: bytes) -> tuple[int, str, bytes]:
+        return 400, "Bad Request", b"bad payload"
 
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(pub, "_post", fake_post)
 
     with pytest.raises(RuntimeError) as e:
         pub.publish_view({"a": 1}, label="L", host="127.0.0.1", port=8000)
@@ -138,23 +134,10 @@ def test_publish_view_http_error_raises_in_debug(
 ) -> None:
     monkeypatch.setenv("PLOTSRV_DEBUG", "1")
 
-    class _FakeHTTPError(urllib.error.HTTPError):
-        def __init__(self):
-            super().__init__(
-                url="http://127.0.0.1:8000/publish",
-                code=500,
-                msg="Server Error",
-                hdrs=None,
-                fp=None,
-            )
-
-        def read(self) -> bytes:
-            return b"nope"
-
-    def fake_urlopen(req: urllib.request.Request, timeout: float):
-        raise _FakeHTTPError()
+    def fake_post(host: str, port: int, data: bytes) -> tuple[int, str, bytes]:
+        return 500, "Server Error", b"nope"
 
-    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(pub, "_post", fake_post)
 
     # Use artifact publishing route via publish_view -> kind inferred as plot/table.
     # Simplest: pass a tiny DataFrame without pulling matplotlib.
@@ -6,7 +6,7 @@ from plotsrv.renderers import register_default_renderers
 
 
 def _reset_registry() -> None:
-    reg._RENDERERS.clear()
+    reg.clear_renderers()
 
 
 def test_register_default_renderers_registers_expected_kinds_in_order() -> None:
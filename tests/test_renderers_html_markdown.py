@@ -348,3 +348,71 @@ def test_markdown_renderer_passes_view_id_to_truncation_config(monkeypatch) -> N
     r.render("hi", view_id="docs:md")
 
     assert calls == [("markdown", "docs:md")]
+
+
+def test_optional_module_prefers_sys_modules_and_returns_none_when_missing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from plotsrv.renderers._optdeps import optional_module
+
+    fake = SimpleNamespace()
+    monkeypatch.setitem(sys.modules, "plotsrv_fake_optdep", fake)
+
+    assert optional_module("plotsrv_fake_optdep") is fake
+    assert optional_module("plotsrv_definitely_not_installed") is None
+
+
+def test_markdown_reuses_extension_and_allow_list_constants(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[Any] = []
+
+    def fake_md(text: str, extensions: Any = None) -> str:
+        seen.append(extensions)
+        return "<p>Hi</p>"
+
+    def fake_clean(html: str, **kwargs: Any) -> str:
+        seen.append(kwargs["tags"])
+        return html
+
+    monkeypatch.setitem(sys.modules, "markdown", SimpleNamespace(markdown=fake_md))
+    monkeypatch.setitem(
+        sys.modules,
+        "bleach",
+        SimpleNamespace(
+            clean=fake_clean,
+            linkify=lambda html, callbacks=None: html,
+            callbacks=SimpleNamespace(nofollow=None),
+        ),
+    )
+    monkeypatch.setattr(md_mod.config, "get_markdown_sanitize", lambda: True)
+
+    r = md_mod.MarkdownRenderer()
+    r.render("hi", view_id="v1")
+    r.render("hi", view_id="v2")
+
+    assert seen[0] is seen[2] is md_mod._MD_EXTENSIONS
+    assert seen[1] is seen[3] is md_mod._ALLOWED_TAGS
+    assert "table" in md_mod._ALLOWED_TAGS
+
+
+def test_optional_module_skips_import_when_spec_is_missing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import builtins
+
+    from plotsrv.renderers import _optdeps
+
+    real_import = builtins.__import__
+    attempted: list[str] = []
+
+    def spy_import(name, globals=None, locals=None, fromlist=(), level=0):
+        attempted.append(name)
+        return real_import(name, globals, locals, fromlist, level)
+
+    monkeypatch.setattr(builtins, "__import__", spy_import)
+
+    assert _optdeps.has("json") is True
+    assert _optdeps.has("plotsrv_definitely_not_installed") is False
+    assert _optdeps.optional_module("plotsrv_definitely_not_installed") is None
+    assert "plotsrv_definitely_not_installed" not in attempted
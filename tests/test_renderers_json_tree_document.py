@@ -177,3 +177,24 @@ def test_json_tree_truncated_node_badge_texts() -> None:
     out = r.render(doc, view_id="v1")
 
     assert "more keys" in out.html
+
+
+def test_json_tree_renders_documents_deeper_than_recursion_limit() -> None:
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    leaf: dict[str, Any] = {"display_key": "leaf", "preview": "x", "depth": depth}
+    node = leaf
+    for d in range(depth - 1, -1, -1):
+        node = {
+            "display_key": f"k{d}",
+            "depth": d,
+            "expandable": True,
+            "children": [node],
+        }
+
+    doc = {"type": "plotsrv_json_document", "root": node, "meta": {}}
+    out = JsonTreeRenderer().render(doc, view_id="v1")
+
+    assert 'data-json-key="leaf"' in out.html
+    assert out.html.count("<li>") == out.html.count("</li>") == 2 * depth
@@ -70,3 +70,37 @@ def test_json_tree_truncates_by_max_nodes() -> None:
         "max_depth",
     )
     assert "node limit" in out.html or "…" in out.html
+
+
+def test_json_tree_marks_capped_descendant_counts() -> None:
+    r = JsonTreeRenderer(
+        limits=JsonLimits(
+            max_depth=10,
+            max_nodes=10,
+            max_string_chars=1000,
+            max_list_items=2,
+            max_dict_items=200,
+        )
+    )
+    out = r.render({"xs": [[1, 2]] * 100}, view_id="v1")
+
+    assert "+ nested entries total" in out.html
+
+
+def test_json_tree_nested_children_are_balanced() -> None:
+    r = JsonTreeRenderer()
+    out = r.render({"a": [1, {"b": [2, 3]}], "c": {"d": {}}}, view_id="v1")
+
+    assert out.html.count("<li>") == out.html.count("</li>")
+    assert out.html.count("<details open") == out.html.count("</details>")
+    assert out.html.count('<ul class="ps-json-children">') == out.html.count(
+        '<ul class="json-children">'
+    )
+
+
+def test_json_tree_escapes_keys_and_flattens_newlines_in_attrs() -> None:
+    out = JsonTreeRenderer().render({"<k'\"&>": "a\nb"}, view_id="v1")
+
+    assert 'data-json-key="&lt;k&#39;&quot;&amp;&gt;"' in out.html
+    assert 'data-json-full-value="a b"' in out.html
+    assert "<k'" not in out.html
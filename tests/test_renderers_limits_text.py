@@ -8,7 +8,7 @@ from plotsrv.renderers.text import TextRenderer
 def test_truncate_text_no_truncation() -> None:
     s = "hello\nworld\n"
     out, trunc = truncate_text(s, limits=TextLimits(max_chars=100, max_lines=None))
-    assert out == s
+    assert out is s
     assert trunc.truncated is False
 
 
@@ -13,7 +13,7 @@ from plotsrv.artifacts import Truncation
 
 def _reset_registry() -> None:
     # registry is module-global; clear it between tests
-    reg._RENDERERS.clear()
+    reg.clear_renderers()
 
 
 @dataclass
@@ -93,6 +93,16 @@ def test_render_any_falls_back_to_repr_when_no_renderer() -> None:
     assert rr.meta and rr.meta.get("fallback") is True
 
 
+def test_render_any_fallback_bounds_large_containers() -> None:
+    _reset_registry()
+
+    rr = reg.render_any(list(range(100_000)), view_id="v1")
+    assert rr.meta and rr.meta.get("fallback") is True
+    assert rr.html.startswith("<pre>[0, 1, 2,")
+    assert "..." in rr.html
+    assert len(rr.html) < 1_000
+
+
 def test_render_any_uses_renderer_when_available() -> None:
     _reset_registry()
     reg.register_renderer(DummyRenderer(kind="text", _can=True))
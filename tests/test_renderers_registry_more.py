@@ -5,6 +5,7 @@ from typing import Any
 
 import plotsrv.renderers.registry as reg
 from plotsrv.artifacts import Truncation
+from plotsrv.renderers._escape import escape_attr, escape_html
 from plotsrv.renderers.base import RenderResult
 
 
@@ -50,6 +51,10 @@ def test_register_renderer_replaces_existing_kind() -> None:
     assert reg._RENDERERS == [other, second]
     assert not any(r is first for r in reg._RENDERERS)
     assert any(r is second for r in reg._RENDERERS)
+    assert reg.choose_renderer("x", kind_hint="text") is second
+
+    reg.clear_renderers()
+    assert reg._BY_KIND == {}
 
 
 def test_choose_renderer_kind_hint_falls_back_when_hint_cannot_render() -> None:
@@ -123,10 +128,14 @@ def test_choose_renderer_returns_none_when_nothing_matches() -> None:
 
 
 def test_escape_html_escapes_all_special_chars() -> None:
-    s = reg._escape_html("""<&>"'""")
+    s = escape_html("""<&>"'""")
     assert s == "&lt;&amp;&gt;&quot;&#39;"
 
 
+def test_escape_attr_also_flattens_newlines() -> None:
+    assert escape_attr("a\r\nb<") == "a  b&lt;"
+
+
 def test_looks_like_html_more_cases() -> None:
     assert reg._looks_like_html("<!DOCTYPE html><html></html>") is True
     assert reg._looks_like_html("<table><tr></tr></table>") is True
@@ -135,3 +144,7 @@ def test_looks_like_html_more_cases() -> None:
     assert reg._looks_like_html("   no <div>x</div>") is False
     assert reg._looks_like_html("<") is False
     assert reg._looks_like_html("<notclosed") is False
+    # the closing ">" must appear within the first 2000 characters
+    assert reg._looks_like_html("<" + "a" * 1998 + ">") is True
+    assert reg._looks_like_html("<" + "a" * 1999 + ">") is False
+    assert reg._looks_like_html("<1>") is False
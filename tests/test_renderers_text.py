@@ -45,6 +45,15 @@ def test_to_text_and_anchor_bytes_valid_utf8() -> None:
     assert anchor == "head"
 
 
+def test_to_text_and_anchor_bytes_invalid_utf8_and_bytearray() -> None:
+    text, _ = _to_text_and_anchor(b"a\xffb")
+    assert text == "a\ufffdb"
+
+    text, anchor = _to_text_and_anchor(bytearray(ANCHOR_PREFIX.encode() + b"tail\nx"))
+    assert text == "x"
+    assert anchor == "tail"
+
+
 def test_to_text_and_anchor_repr_fallback() -> None:
     text, anchor = _to_text_and_anchor({"a": 1})
     assert text == "{'a': 1}"
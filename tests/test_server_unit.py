@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from pathlib import Path
@@ -13,18 +14,25 @@ import plotsrv.server as srv
 from plotsrv.storage.models import LatestMeta, LoadedLatest
 
 
+# Server globals as they are before any server has been started.
+_SERVER_DEFAULTS: dict[str, Any] = {
+    "_SERVER_RUNNING": False,
+    "_SERVER_STARTING": False,
+    "_SERVER_THREAD": None,
+    "_SERVER": None,
+    "_CURRENT_HOST": "0.0.0.0",
+    "_CURRENT_PORT": 8000,
+}
+
+
 @pytest.fixture(autouse=True)
 def reset_state(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Reset store and server globals around each test.
+    # Reset store and server globals around each test. monkeypatch restores
+    # the server globals afterwards, so nothing leaks into other modules.
     store.reset()
 
-    srv._SERVER_RUNNING = False
-    srv._SERVER_STARTING = False
-    srv._SERVER_THREAD = None
-    srv._SERVER = None
-    srv._CURRENT_HOST = "0.0.0.0"
-    srv._CURRENT_PORT = 8000
-
+    for name, value in _SERVER_DEFAULTS.items():
+        monkeypatch.setattr(srv, name, value)
     monkeypatch.setattr(srv, "enqueue_snapshot", lambda **kwargs: False)
 
     # ensure matplotlib show is unpatched
@@ -41,6 +49,20 @@ def reset_state(monkeypatch: pytest.MonkeyPatch) -> None:
         srv._unpatch_matplotlib_show()
 
 
+@pytest.fixture(scope="module")
+def sample_fig() -> Iterator[plt.Figure]:
+    # refresh_view only reads the figure, so one per module is enough.
+    fig = plt.figure()
+    fig.add_subplot(111).plot([1, 2], [3, 4])
+    yield fig
+    plt.close(fig)
+
+
+@pytest.fixture(scope="module")
+def sample_df() -> pd.DataFrame:
+    return pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+
+
 @pytest.fixture
 def fake_run_server(monkeypatch: pytest.MonkeyPatch) -> None:
     def _fake_run_server(host: str, port: int, quiet: bool) -> None:
@@ -50,21 +72,21 @@ def fake_run_server(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(srv, "_run_server", _fake_run_server)
 
 
-def test_refresh_view_with_figure_sets_plot(fake_run_server: None) -> None:
-    fig = plt.figure()
-    ax = fig.add_subplot(111)
-    ax.plot([1, 2], [3, 4])
-
-    srv.refresh_view(fig)
+def test_refresh_view_with_figure_sets_plot(
+    fake_run_server: None, sample_fig: plt.Figure
+) -> None:
+    srv.refresh_view(sample_fig)
 
     assert store.get_kind() == "plot"
     assert store.has_plot() is True
     assert len(store.get_plot()) > 0
 
 
-def test_refresh_view_with_dataframe_simple(fake_run_server: None) -> None:
+def test_refresh_view_with_dataframe_simple(
+    fake_run_server: None, sample_df: pd.DataFrame
+) -> None:
     config.set_table_view_mode("simple")
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df = sample_df
 
     srv.refresh_view(df)
 
@@ -72,16 +94,18 @@ def test_refresh_view_with_dataframe_simple(fake_run_server: None) -> None:
     assert store.has_table() is True
 
     out_df = store.get_table_df()
-    assert out_df.equals(df)
+    pd.testing.assert_frame_equal(out_df, df)
 
     html = store.get_table_html_simple()
     assert "<table" in html
     assert "a" in html and "b" in html
 
 
-def test_refresh_view_with_dataframe_rich(fake_run_server: None) -> None:
+def test_refresh_view_with_dataframe_rich(
+    fake_run_server: None, sample_df: pd.DataFrame
+) -> None:
     config.set_table_view_mode("rich")
-    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df = sample_df
 
     srv.refresh_view(df)
 
@@ -89,7 +113,7 @@ def test_refresh_view_with_dataframe_rich(fake_run_server: None) -> None:
     assert store.has_table() is True
 
     out_df = store.get_table_df()
-    assert out_df.equals(df)
+    pd.testing.assert_frame_equal(out_df, df)
 
     # in rich mode, we should not have pre-rendered HTML stored
     with pytest.raises(LookupError):
@@ -207,7 +231,7 @@ def test_refresh_view_with_dataframe_named_view(fake_run_server: None) -> None:
     vid = "analysis:rows"
     assert store.get_kind(vid) == "table"
     assert store.has_table(view_id=vid) is True
-    assert store.get_table_df(view_id=vid).equals(df)
+    pd.testing.assert_frame_equal(store.get_table_df(view_id=vid), df)
 
     views = {v.view_id: v for v in store.list_views()}
     assert views[vid].label == "rows"
@@ -268,6 +292,14 @@ def test_object_to_figure_force_plotnine_draws_object() -> None:
         plt.close(fig)
 
 
+def test_object_to_figure_accepts_loaded_plotnine_subclass(fake_ggplot: type) -> None:
+    class UserPlot(fake_ggplot):  # type: ignore[misc, valid-type]
+        pass
+
+    assert srv._looks_like_plot_object(UserPlot()) is True
+    assert srv._object_to_figure(UserPlot(), force_plotnine=False) is fake_ggplot.figure
+
+
 def test_patch_matplotlib_show_idempotent() -> None:
     original = plt.show
 
@@ -423,6 +455,25 @@ def test_start_server_applies_runtime_options(monkeypatch, tmp_path):
     ]
 
 
+def test_start_server_restores_latest_only_when_starting(
+    monkeypatch: pytest.MonkeyPatch, fake_run_server: None
+) -> None:
+    restores: list[int] = []
+    monkeypatch.setattr(
+        srv, "restore_latest_views_from_storage", lambda: restores.append(1) or 0
+    )
+    monkeypatch.setattr(srv, "_patch_matplotlib_show", lambda: None)
+
+    srv.start_server(host="127.0.0.1", port=8123)
+    srv._SERVER_THREAD.join(timeout=2.0)  # type: ignore[union-attr]
+    assert srv._SERVER_RUNNING is True
+
+    # Already running: the same call must not reload persisted views.
+    srv.start_server(host="127.0.0.1", port=8123)
+
+    assert restores == [1]
+
+
 def test_start_server_starts_watch_threads(monkeypatch):
     import plotsrv.server as srv
 
@@ -534,6 +585,47 @@ def test_refresh_view_pathlike_text_file(fake_run_server: None, tmp_path) -> Non
     assert "line one" in art.obj
 
 
+def test_refresh_view_update_limit_drops_refreshes_within_window(
+    fake_run_server: None,
+) -> None:
+    srv.refresh_view("one", label="msg", section="debug", update_limit_s=60)
+    srv.refresh_view("two", label="msg", section="debug", update_limit_s=60)
+
+    assert store.get_artifact(view_id="debug:msg").obj == "one"
+
+    srv.refresh_view(
+        "three", label="msg", section="debug", update_limit_s=60, force=True
+    )
+
+    assert store.get_artifact(view_id="debug:msg").obj == "three"
+
+
+def test_refresh_view_unthrottled_refresh_starts_the_window(
+    fake_run_server: None,
+) -> None:
+    srv.refresh_view("one", label="msg", section="debug")
+    srv.refresh_view("two", label="msg", section="debug", update_limit_s=60)
+
+    assert store.get_artifact(view_id="debug:msg").obj == "one"
+
+
+def test_refresh_view_failed_forced_refresh_does_not_start_the_window(
+    fake_run_server: None,
+) -> None:
+    with pytest.raises(ValueError):
+        srv.refresh_view(
+            "one",
+            label="msg",
+            section="debug",
+            kind="bad",
+            update_limit_s=60,
+            force=True,
+        )
+    srv.refresh_view("two", label="msg", section="debug", update_limit_s=60)
+
+    assert store.get_artifact(view_id="debug:msg").obj == "two"
+
+
 def test_refresh_view_invalid_forced_kind_raises(fake_run_server: None) -> None:
     with pytest.raises(ValueError):
         srv.refresh_view({"x": 1}, kind="bad")
@@ -696,7 +788,7 @@ def test_restore_latest_views_from_storage_restores_table(
 
     assert restored == 1
     assert store.get_kind("etl:table") == "table"
-    assert store.get_table_df(view_id="etl:table").equals(df)
+    pd.testing.assert_frame_equal(store.get_table_df(view_id="etl:table"), df)
     assert store.get_table_counts(view_id="etl:table") == (99, 2)
     assert store.get_status(view_id="etl:table")["last_updated"] == meta.updated_at
 
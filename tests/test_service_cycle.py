@@ -1,22 +1,76 @@
 from __future__ import annotations
 
-import threading
-import time
-import types
+import importlib.util
 import sys
+import threading
+from collections.abc import Callable
+
+import pytest
 
 from plotsrv.service import RunnerService, ServiceConfig
 
 
-def test_service_runs_once_and_publishes(monkeypatch) -> None:
-    # Create a fake module with a function
-    mod = types.ModuleType("plotsrv_service_testmod")
+@pytest.fixture
+def fake_target_module(monkeypatch: pytest.MonkeyPatch) -> Callable[[str, object], str]:
+    """
+    Register a throwaway module exposing f() -> value and return its target.
+
+    The module is removed from sys.modules again when the test finishes.
+    """
+
+    def _make(name: str, value: object) -> str:
+        # Built from a spec so the fake looks like an imported module
+        # (__spec__ set) to anything that inspects it.
+        spec = importlib.util.spec_from_loader(name, loader=None)
+        assert spec is not None
+        mod = importlib.util.module_from_spec(spec)
+        mod.f = lambda: value  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, name, mod)
+        return f"{name}:f"
+
+    return _make
+
+
+# RunnerService hooks stubbed by service_calls, and the name each one records.
+_SERVICE_HOOKS = {
+    "plotsrv.service.start_server": "start",
+    "plotsrv.service.stop_server": "stop",
+    "plotsrv.service.refresh_view": "publish",
+    "plotsrv.service.store.mark_success": "success",
+    "plotsrv.service.store.mark_error": "error",
+}
+
+
+@pytest.fixture
+def service_events() -> dict[str, threading.Event]:
+    """One event per recorded call name, set when that hook first runs."""
+    return {name: threading.Event() for name in _SERVICE_HOOKS.values()}
+
 
-    def f():
-        return 123
+@pytest.fixture
+def service_calls(
+    monkeypatch: pytest.MonkeyPatch, service_events: dict[str, threading.Event]
+) -> list[str]:
+    """Stub server/store hooks used by RunnerService and record the calls."""
+    calls: list[str] = []
+
+    def _recorder(name: str) -> Callable[..., None]:
+        def _hook(*args: object, **kwargs: object) -> None:
+            calls.append(name)
+            service_events[name].set()
+
+        return _hook
 
-    mod.f = f  # type: ignore[attr-defined]
-    sys.modules["plotsrv_service_testmod"] = mod
+    for target, name in _SERVICE_HOOKS.items():
+        monkeypatch.setattr(target, _recorder(name))
+    return calls
+
+
+def test_service_runs_once_and_publishes(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_target_module: Callable[[str, object], str],
+) -> None:
+    target = fake_target_module("plotsrv_service_testmod", 123)
 
     published: list[object] = []
 
@@ -28,7 +82,7 @@ def test_service_runs_once_and_publishes(monkeypatch) -> None:
     )
 
     cfg = ServiceConfig(
-        target="plotsrv_service_testmod:f",
+        target=target,
         host="127.0.0.1",
         port=8000,
         refresh_rate=120,
@@ -42,35 +96,14 @@ def test_service_runs_once_and_publishes(monkeypatch) -> None:
     assert published == [123]
 
 
-def test_once_stops_server_by_default(monkeypatch) -> None:
-    mod = types.ModuleType("plotsrv_service_once_mod")
-
-    def f():
-        return 123
-
-    mod.f = f  # type: ignore[attr-defined]
-    sys.modules["plotsrv_service_once_mod"] = mod
-
-    calls: list[str] = []
-
-    monkeypatch.setattr(
-        "plotsrv.service.start_server", lambda **kwargs: calls.append("start")
-    )
-    monkeypatch.setattr("plotsrv.service.stop_server", lambda: calls.append("stop"))
-    monkeypatch.setattr(
-        "plotsrv.service.refresh_view",
-        lambda obj=None, **kwargs: calls.append("publish"),
-    )
-    monkeypatch.setattr(
-        "plotsrv.service.store.mark_success", lambda **kwargs: calls.append("success")
-    )
-    monkeypatch.setattr(
-        "plotsrv.service.store.mark_error",
-        lambda *args, **kwargs: calls.append("error"),
-    )
+def test_once_stops_server_by_default(
+    fake_target_module: Callable[[str, object], str],
+    service_calls: list[str],
+) -> None:
+    calls = service_calls
 
     cfg = ServiceConfig(
-        target="plotsrv_service_once_mod:f",
+        target=fake_target_module("plotsrv_service_once_mod", 123),
         host="127.0.0.1",
         port=8000,
         refresh_rate=120,
@@ -86,35 +119,15 @@ def test_once_stops_server_by_default(monkeypatch) -> None:
     assert "stop" in calls  # <-- key behaviour
 
 
-def test_once_keep_alive_waits_until_stop(monkeypatch) -> None:
-    mod = types.ModuleType("plotsrv_service_keepalive_mod")
-
-    def f():
-        return 456
-
-    mod.f = f  # type: ignore[attr-defined]
-    sys.modules["plotsrv_service_keepalive_mod"] = mod
-
-    calls: list[str] = []
-
-    monkeypatch.setattr(
-        "plotsrv.service.start_server", lambda **kwargs: calls.append("start")
-    )
-    monkeypatch.setattr("plotsrv.service.stop_server", lambda: calls.append("stop"))
-    monkeypatch.setattr(
-        "plotsrv.service.refresh_view",
-        lambda obj=None, **kwargs: calls.append("publish"),
-    )
-    monkeypatch.setattr(
-        "plotsrv.service.store.mark_success", lambda **kwargs: calls.append("success")
-    )
-    monkeypatch.setattr(
-        "plotsrv.service.store.mark_error",
-        lambda *args, **kwargs: calls.append("error"),
-    )
+def test_once_keep_alive_waits_until_stop(
+    fake_target_module: Callable[[str, object], str],
+    service_calls: list[str],
+    service_events: dict[str, threading.Event],
+) -> None:
+    calls = service_calls
 
     cfg = ServiceConfig(
-        target="plotsrv_service_keepalive_mod:f",
+        target=fake_target_module("plotsrv_service_keepalive_mod", 456),
         host="127.0.0.1",
         port=8000,
         refresh_rate=120,
@@ -127,10 +140,9 @@ def test_once_keep_alive_waits_until_stop(monkeypatch) -> None:
     t = threading.Thread(target=svc.run, daemon=True)
     t.start()
 
-    # Let it start + publish once
-    time.sleep(0.2)
-    assert "start" in calls
-    assert "publish" in calls
+    # Wait for it to start + publish once
+    assert service_events["start"].wait(timeout=2.0)
+    assert service_events["publish"].wait(timeout=2.0)
 
     # It should still be alive until we stop it
     assert t.is_alive()
@@ -39,7 +39,7 @@ def test_set_table_sets_kind_and_dataframe_and_html() -> None:
     assert store.has_plot() is False
 
     out_df = store.get_table_df()
-    assert out_df.equals(df)
+    pd.testing.assert_frame_equal(out_df, df)
 
     assert store.get_table_html_simple() == html
 
@@ -102,30 +102,25 @@ def test_set_active_view_affects_backcompat_calls() -> None:
     assert store.get_plot(view_id=v2) == b"two"
 
 
-def test_should_accept_publish_throttles_when_limit_set() -> None:
+@pytest.mark.parametrize(
+    ("limit", "publishes"),
+    [
+        # first publish accepted, repeat within the window rejected, then
+        # accepted again once the window has passed
+        (10, [(100.0, True), (105.0, False), (110.0, True)]),
+        # no limit -> always accept
+        (None, [(0.0, True), (0.1, True)]),
+    ],
+)
+def test_should_accept_publish(
+    limit: int | None, publishes: list[tuple[float, bool]]
+) -> None:
     vid = store.register_view(section="s", label="x")
-    assert (
-        store.should_accept_publish(view_id=vid, update_limit_s=10, now_s=100.0) is True
-    )
-    # immediately again -> reject
-    assert (
-        store.should_accept_publish(view_id=vid, update_limit_s=10, now_s=105.0)
-        is False
-    )
-    # after window -> accept
-    assert (
-        store.should_accept_publish(view_id=vid, update_limit_s=10, now_s=110.0) is True
-    )
-
-
-def test_should_accept_publish_accepts_when_no_limit() -> None:
-    vid = store.register_view(section="s", label="x")
-    assert (
-        store.should_accept_publish(view_id=vid, update_limit_s=None, now_s=0.0) is True
-    )
-    assert (
-        store.should_accept_publish(view_id=vid, update_limit_s=None, now_s=0.1) is True
-    )
+    for now_s, expected in publishes:
+        assert (
+            store.should_accept_publish(view_id=vid, update_limit_s=limit, now_s=now_s)
+            is expected
+        )
 
 
 def test_traceback_artifact_uses_traceback_icon_key() -> None:
@@ -22,19 +22,37 @@ class DummyResp:
         return b"ok"
 
 
+# Stateless, so one response serves every fake urlopen call.
+_DUMMY_RESP = DummyResp()
+
+
 def _raise_here() -> None:
     # Keep this as a real source line for linecache context checks.
     x = 1  # noqa: F841
     raise ValueError("boom")
 
 
-def test_build_traceback_payload_includes_frames_and_context() -> None:
+@pytest.fixture(scope="module")
+def raised_exc() -> BaseException:
+    """
+    One real exception (with traceback) from _raise_here(), shared by the module.
+
+    Building the payload only reads e.__traceback__, so sharing it is safe.
+    """
     try:
         _raise_here()
-    except Exception as e:
-        payload = tb_mod._build_traceback_payload(
-            e, options=tb_mod.TracebackPublishOptions(context_lines=1, max_frames=50)
-        )
+    except ValueError as e:
+        return e
+    raise AssertionError("_raise_here() did not raise")
+
+
+def test_build_traceback_payload_includes_frames_and_context(
+    raised_exc: BaseException,
+) -> None:
+    payload = tb_mod._build_traceback_payload(
+        raised_exc,
+        options=tb_mod.TracebackPublishOptions(context_lines=1, max_frames=50),
+    )
 
     assert payload["type"] == "traceback"
     assert payload["exc_type"] == "ValueError"
@@ -53,7 +71,9 @@ def test_build_traceback_payload_includes_frames_and_context() -> None:
     assert len(top["context_after"]) <= 1
 
 
-def test_publish_traceback_remote_posts(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_publish_traceback_remote_posts(
+    monkeypatch: pytest.MonkeyPatch, raised_exc: BaseException
+) -> None:
     captured: dict[str, Any] = {}
 
     monkeypatch.setattr(tb_mod.config, "get_tracebacks_enabled", lambda: True)
@@ -62,24 +82,21 @@ def test_publish_traceback_remote_posts(monkeypatch: pytest.MonkeyPatch) -> None
         captured["url"] = req.full_url
         captured["data"] = req.data
         captured["headers"] = dict(req.headers)
-        return DummyResp()
+        return _DUMMY_RESP
 
     monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
 
-    try:
-        _raise_here()
-    except Exception as e:
-        tb_mod.publish_traceback(
-            e,
-            host="127.0.0.1",
-            port=8000,
-            label="L",
-            section="S",
-            view_id="S:L",
-            update_limit_s=3,
-            force=True,
-            options=tb_mod.TracebackPublishOptions(context_lines=0, max_frames=1),
-        )
+    tb_mod.publish_traceback(
+        raised_exc,
+        host="127.0.0.1",
+        port=8000,
+        label="L",
+        section="S",
+        view_id="S:L",
+        update_limit_s=3,
+        force=True,
+        options=tb_mod.TracebackPublishOptions(context_lines=0, max_frames=1),
+    )
 
     assert captured["url"] == "http://127.0.0.1:8000/publish"
     post = json.loads(captured["data"].decode("utf-8"))
@@ -95,7 +112,9 @@ def test_publish_traceback_remote_posts(monkeypatch: pytest.MonkeyPatch) -> None
     assert len(post["artifact"]["frames"]) <= 1
 
 
-def test_publish_traceback_inprocess_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_publish_traceback_inprocess_fallback(
+    monkeypatch: pytest.MonkeyPatch, raised_exc: BaseException
+) -> None:
     calls: dict[str, Any] = {}
 
     monkeypatch.setattr(tb_mod.config, "get_tracebacks_enabled", lambda: True)
@@ -123,10 +142,7 @@ def test_publish_traceback_inprocess_fallback(monkeypatch: pytest.MonkeyPatch) -
     monkeypatch.setattr(tb_mod.store, "set_artifact", fake_set_artifact)
     monkeypatch.setattr(tb_mod.store, "mark_error", fake_mark_error)
 
-    try:
-        _raise_here()
-    except Exception as e:
-        tb_mod.publish_traceback(e, label="L", section="S", view_id="S:L")
+    tb_mod.publish_traceback(raised_exc, label="L", section="S", view_id="S:L")
 
     assert calls["set_artifact"]["kind"] == "traceback"
     assert calls["set_artifact"]["label"] == "L"
@@ -138,6 +154,7 @@ def test_publish_traceback_inprocess_fallback(monkeypatch: pytest.MonkeyPatch) -
 
 def test_publish_traceback_disabled_marks_safe_error_inprocess(
     monkeypatch: pytest.MonkeyPatch,
+    raised_exc: BaseException,
 ) -> None:
     monkeypatch.setattr(tb_mod.config, "get_tracebacks_enabled", lambda: False)
 
@@ -152,10 +169,7 @@ def test_publish_traceback_disabled_marks_safe_error_inprocess(
     monkeypatch.setattr(tb_mod.store, "set_artifact", fake_set_artifact)
     monkeypatch.setattr(tb_mod.store, "mark_error", fake_mark_error)
 
-    try:
-        _raise_here()
-    except Exception as e:
-        tb_mod.publish_traceback(e, label="L", section="S", view_id="S:L")
+    tb_mod.publish_traceback(raised_exc, label="L", section="S", view_id="S:L")
 
     assert "set_artifact" not in calls
     assert calls["mark_error"]["view_id"] == "S:L"
@@ -164,6 +178,7 @@ def test_publish_traceback_disabled_marks_safe_error_inprocess(
 
 def test_publish_traceback_disabled_does_not_post(
     monkeypatch: pytest.MonkeyPatch,
+    raised_exc: BaseException,
 ) -> None:
     monkeypatch.setattr(tb_mod.config, "get_tracebacks_enabled", lambda: False)
 
@@ -172,13 +187,10 @@ def test_publish_traceback_disabled_does_not_post(
     def fake_urlopen(req: urllib.request.Request, timeout: float):
         nonlocal called
         called = True
-        return DummyResp()
+        return _DUMMY_RESP
 
     monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
 
-    try:
-        _raise_here()
-    except Exception as e:
-        tb_mod.publish_traceback(e, host="127.0.0.1", port=8000)
+    tb_mod.publish_traceback(raised_exc, host="127.0.0.1", port=8000)
 
     assert called is False
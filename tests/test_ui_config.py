@@ -3,19 +3,22 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 import plotsrv.settings as settings
 import plotsrv.ui_config as ui_config
 
 
-def _reset_ui_cache() -> None:
-    ui_config._UI_SETTINGS = None  # type: ignore[attr-defined]
-    ui_config._UI_CACHE_KEY = None  # type: ignore[attr-defined]
-    settings._CTX = settings.RuntimeContext()  # type: ignore[attr-defined]
-    settings._CONFIG_CACHE.clear()  # type: ignore[attr-defined]
+@pytest.fixture(autouse=True)
+def reset_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Fresh UI/config caches per test; monkeypatch restores the originals.
+    monkeypatch.setattr(ui_config, "_UI_SETTINGS", None)
+    monkeypatch.setattr(ui_config, "_UI_CACHE_KEY", None)
+    monkeypatch.setattr(settings, "_CTX", settings.RuntimeContext())
+    monkeypatch.setattr(settings, "_CONFIG_CACHE", {})
 
 
 def test_load_ui_settings_defaults_when_no_config(monkeypatch, tmp_path: Path) -> None:
-    _reset_ui_cache()
     monkeypatch.chdir(tmp_path)
     monkeypatch.delenv("PLOTSRV_CONFIG", raising=False)
     monkeypatch.delenv("PLOTSRV_NAME", raising=False)
@@ -33,8 +36,6 @@ def test_load_ui_settings_defaults_when_no_config(monkeypatch, tmp_path: Path) -
 def test_load_ui_settings_reads_page_title_and_favicon_from_yaml(
     tmp_path: Path,
 ) -> None:
-    _reset_ui_cache()
-
     yml = tmp_path / "plotsrv.yml"
     yml.write_text(
         """
@@ -1,20 +1,29 @@
 # tests/test_watch_args.py
 from __future__ import annotations
 
+import argparse
+
 import pytest
 
 from plotsrv.cli import build_parser, _coerce_watch_specs
 import plotsrv.cli as cli_mod
-import pytest
 
 
-def test_watch_head_before_watch_binds_to_next_watch() -> None:
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    # parse_args keeps per-call state on the namespace, so one parser can be
+    # shared across the module.
+    return build_parser()
+
+
+def test_watch_head_before_watch_binds_to_next_watch(
+    parser: argparse.ArgumentParser,
+) -> None:
     """
     `--watch-head` before a `--watch` should apply to the NEXT watch,
     due to the pending mode behaviour in _WatchReadModeAction.
     """
-    p = build_parser()
-    args = p.parse_args(
+    args = parser.parse_args(
         [
             "run",
             ".",
@@ -31,12 +40,13 @@ def test_watch_head_before_watch_binds_to_next_watch() -> None:
     assert args.watch_read_mode == ["head", None]
 
 
-def test_watch_tail_after_watch_binds_to_most_recent_watch() -> None:
+def test_watch_tail_after_watch_binds_to_most_recent_watch(
+    parser: argparse.ArgumentParser,
+) -> None:
     """
     `--watch-tail` after a `--watch` should bind to that most recent watch.
     """
-    p = build_parser()
-    args = p.parse_args(
+    args = parser.parse_args(
         [
             "run",
             ".",